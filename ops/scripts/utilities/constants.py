@@ -74,6 +74,12 @@ HTTP_CONNECT_TIMEOUT = int(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
 HTTP_READ_TIMEOUT = int(os.getenv("HTTP_READ_TIMEOUT", "30"))
 HTTP_DEFAULT_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
 
+# Connection pooling (keep-alive connections reused across requests)
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))
+
+# Refresh access tokens this many seconds before they expire
+TOKEN_EXPIRY_MARGIN_SECONDS = 300
+
 # Status codes
 HTTP_STATUS_OK = 200
 HTTP_STATUS_CREATED = 201
@@ -226,6 +232,14 @@ CACHE_TTL_SHORT = 300  # 5 minutes
 CACHE_TTL_MEDIUM = 1800  # 30 minutes
 CACHE_TTL_LONG = 3600  # 1 hour
 
+# On-disk cache of workspace name -> ID lookups shared across CLI invocations
+WORKSPACE_ID_CACHE_FILE = os.getenv(
+    "FABRIC_WORKSPACE_ID_CACHE",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "fabric_cicd", "workspace_ids.json"
+    ),
+)
+
 # ============================================================================
 # Error Messages
 # ============================================================================
@@ -4,8 +4,10 @@ Microsoft Fabric API utilities using fabric-cicd library and REST APIs
 
 import os
 import json
+import re
 import logging
 import base64
+import time
 from typing import Dict, Any, Optional, List
 from functools import lru_cache
 import requests
@@ -19,12 +21,75 @@ from .constants import (
     ERROR_MISSING_CREDENTIALS,
     ERROR_AUTHENTICATION_FAILED,
     HTTP_DEFAULT_TIMEOUT,
+    CACHE_TTL_LONG,
+    ENABLE_CACHING,
+    WORKSPACE_ID_CACHE_FILE,
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Workspace-scoped endpoints, capturing the ID and any sub-resource path
+_WORKSPACE_ENDPOINT_RE = re.compile(r"^workspaces/([^/?]+)/?([^?]*)")
+
+
+def _load_workspace_id_cache() -> Dict[str, Any]:
+    """Load the on-disk workspace ID cache, returning {} if missing or unreadable"""
+    try:
+        with open(WORKSPACE_ID_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_workspace_id_cache(cache: Dict[str, Any]) -> None:
+    """Persist the workspace ID cache atomically; failures are non-fatal"""
+    try:
+        os.makedirs(os.path.dirname(WORKSPACE_ID_CACHE_FILE), exist_ok=True)
+        tmp_path = f"{WORKSPACE_ID_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, WORKSPACE_ID_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write workspace ID cache: {e}")
+
+
+def invalidate_cached_workspace_id(
+    tenant_id: Optional[str],
+    workspace_name: Optional[str] = None,
+    workspace_id: Optional[str] = None,
+) -> None:
+    """Evict a workspace from the name -> ID caches (disk and in-process)
+
+    Matches the tenant's entry for workspace_name and any entry resolving to
+    workspace_id, so deleted or recreated workspaces stop resolving to a dead
+    ID before CACHE_TTL_LONG expires.
+    """
+    FabricClient.get_workspace_id.cache_clear()
+    if not ENABLE_CACHING:
+        return
+
+    cache = _load_workspace_id_cache()
+    name_key = f"{tenant_id}:{workspace_name}" if workspace_name else None
+    tenant_prefix = f"{tenant_id}:"
+    stale = [
+        key
+        for key, entry in cache.items()
+        if key == name_key
+        or (
+            workspace_id
+            and key.startswith(tenant_prefix)
+            and isinstance(entry, dict)
+            and entry.get("id") == workspace_id
+        )
+    ]
+    if stale:
+        for key in stale:
+            del cache[key]
+        _save_workspace_id_cache(cache)
+
 
 class FabricClient:
     """Enhanced Fabric API client using fabric-cicd and direct REST calls"""
@@ -74,6 +139,9 @@ class FabricClient:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         response = requests.request(method, url, **kwargs)
 
+        if response.status_code == 404:
+            self._evict_if_workspace_missing(endpoint, response)
+
         if not response.ok:
             logger.error(f"Fabric API error: {response.status_code} - {response.text}")
             response.raise_for_status()
@@ -82,16 +150,77 @@ class FabricClient:
 
     @lru_cache(maxsize=128)
     def get_workspace_id(self, workspace_name: str) -> str:
-        """Get workspace ID by name (cached for performance)"""
+        """Get workspace ID by name (cached for performance)
+
+        Lookups are memoized in-process and in WORKSPACE_ID_CACHE_FILE for
+        CACHE_TTL_LONG seconds, so repeated CLI invocations skip the listing.
+        """
+        cache_key = f"{self.tenant_id}:{workspace_name}"
+        cache = _load_workspace_id_cache() if ENABLE_CACHING else {}
+        entry = cache.get(cache_key)
+        if (
+            isinstance(entry, dict)
+            and time.time() - entry.get("cached_at", 0) < CACHE_TTL_LONG
+        ):
+            logger.debug(f"Using disk-cached workspace ID for '{workspace_name}'")
+            return entry["id"]
+
         response = self._make_request("GET", "workspaces")
         workspaces = response.json().get("value", [])
 
+        # Cache every workspace from the listing; later lookups are then free
+        # (first match wins for duplicate names, as with the lookup itself)
+        now = time.time()
+        listed: Dict[str, Any] = {}
         for workspace in workspaces:
-            if workspace["displayName"] == workspace_name:
-                logger.debug(f"Cached workspace ID for '{workspace_name}'")
-                return workspace["id"]
+            listed.setdefault(
+                f"{self.tenant_id}:{workspace['displayName']}",
+                {"id": workspace["id"], "cached_at": now},
+            )
 
-        raise ValueError(f"Workspace '{workspace_name}' not found")
+        if ENABLE_CACHING:
+            cache.update(listed)
+            _save_workspace_id_cache(cache)
+
+        entry = listed.get(cache_key)
+        if entry is None:
+            raise ValueError(f"Workspace '{workspace_name}' not found")
+        workspace_id = entry["id"]
+
+        logger.debug(f"Cached workspace ID for '{workspace_name}'")
+        return workspace_id
+
+    def _evict_if_workspace_missing(
+        self, endpoint: str, response: requests.Response
+    ) -> None:
+        """Evict a cached workspace ID when a 404 says the workspace is gone
+
+        A 404 on a sub-resource (item, folder, bulkMoveItems) usually means only
+        that resource is missing, so it evicts only when the error body reports
+        WorkspaceNotFound.
+        """
+        match = _WORKSPACE_ENDPOINT_RE.match(endpoint.lstrip("/"))
+        if not match:
+            return
+
+        workspace_id, sub_resource = match.groups()
+        if sub_resource:
+            try:
+                error = response.json()
+            except ValueError:
+                return
+            if not isinstance(error, dict):
+                return
+            if error.get("errorCode") != "WorkspaceNotFound":
+                return
+
+        self._invalidate_workspace_id(workspace_id=workspace_id)
+
+    def _invalidate_workspace_id(
+        self, workspace_name: Optional[str] = None, workspace_id: Optional[str] = None
+    ) -> None:
+        """Drop a stale workspace name -> ID mapping from the caches"""
+        invalidate_cached_workspace_id(self.tenant_id, workspace_name, workspace_id)
 
     def list_workspace_items(
         self, workspace_id: str, item_type: Optional[str] = None
@@ -26,10 +26,14 @@ Status: Preview API (October 2025)
 """
 
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import requests
+
 from .fabric_api import FabricClient
 from .output import (
     console_info as print_info,
@@ -42,6 +46,9 @@ from .output import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent API calls for per-item/per-folder fan-out operations
+MAX_CONCURRENT_REQUESTS = 10
+
 
 class FolderValidationError(Exception):
     """Raised when folder validation fails"""
@@ -53,6 +60,22 @@ class FolderOperationError(Exception):
     pass
 
 
+class FolderStructureError(FolderOperationError):
+    """Raised when some folders of a structure could not be created
+
+    Attributes:
+        folder_ids: Map of folder_name -> folder_id for folders that were created
+        errors: Map of folder_name -> exception for folders that were not
+    """
+
+    def __init__(
+        self, message: str, folder_ids: Dict[str, str], errors: Dict[str, Exception]
+    ):
+        super().__init__(message)
+        self.folder_ids = folder_ids
+        self.errors = errors
+
+
 @dataclass
 class FolderInfo:
     """Represents a Fabric folder with its properties"""
@@ -586,11 +609,17 @@ class FabricFolderManager:
                 "itemIds": item_ids
             }
             
-            response = self.fabric_client._make_request("POST", endpoint, json=body)
+            try:
+                response = self.fabric_client._make_request("POST", endpoint, json=body)
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                logger.info("Bulk move endpoint unavailable, moving items individually")
+                return self._move_items_individually(workspace_id, item_ids, target_folder_id)
             data = response.json()
             
-            # Parse results
-            results = {}
+            # Parse results, reporting items missing from the response as failed
+            results = {item_id: False for item_id in item_ids}
             for result in data.get("results", []):
                 item_id = result["itemId"]
                 success = result.get("status") == "Success"
@@ -606,6 +635,31 @@ class FabricFolderManager:
             logger.error(error_msg)
             raise FolderOperationError(error_msg) from e
     
+    def _move_items_individually(
+        self,
+        workspace_id: str,
+        item_ids: List[str],
+        target_folder_id: Optional[str]
+    ) -> Dict[str, bool]:
+        """Move items one request per item, dispatched concurrently"""
+        def move_one(item_id: str) -> bool:
+            try:
+                endpoint = f"workspaces/{workspace_id}/items/{item_id}/move"
+                body = {"targetFolderId": target_folder_id}
+                self.fabric_client._make_request("POST", endpoint, json=body)
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to move item {item_id}: {str(e)}")
+                return False
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            results = dict(zip(item_ids, executor.map(move_one, item_ids)))
+        
+        success_count = sum(results.values())
+        logger.info(f"Moved {success_count}/{len(item_ids)} items successfully")
+        
+        return results
+    
     # ========================================================================
     # FOLDER STRUCTURE OPERATIONS
     # ========================================================================
@@ -629,21 +683,16 @@ class FabricFolderManager:
         """
         folders = self.list_folders(workspace_id, include_subfolders=True)
         
-        # Separate root folders and subfolders
-        root_folders = [f for f in folders if f.parent_folder_id is None]
-        subfolders = [f for f in folders if f.parent_folder_id is not None]
+        # Group by parent in a single pass (None = root level)
+        children_by_parent: Dict[Optional[str], List[FolderInfo]] = defaultdict(list)
+        for folder in folders:
+            children_by_parent[folder.parent_folder_id].append(folder)
         
-        # Build subfolder map
-        subfolder_map: Dict[str, List[FolderInfo]] = {}
-        for folder in subfolders:
-            parent_id = folder.parent_folder_id
-            if parent_id not in subfolder_map:
-                subfolder_map[parent_id] = []
-            subfolder_map[parent_id].append(folder)
+        root_folders = children_by_parent.pop(None, [])
         
         return FolderStructure(
             root_folders=root_folders,
-            subfolder_map=subfolder_map
+            subfolder_map=dict(children_by_parent)
         )
     
     def create_folder_structure(
@@ -663,6 +712,10 @@ class FabricFolderManager:
         Returns:
             Dict[str, str]: Map of folder_name -> folder_id
         
+        Raises:
+            FolderStructureError: If any folder fails; every other folder is
+                still attempted and the created IDs are on the exception
+        
         Example:
             >>> structure = {
             ...     "Bronze Layer": {
@@ -673,27 +726,52 @@ class FabricFolderManager:
             ... }
             >>> folder_ids = manager.create_folder_structure(workspace_id, structure)
         """
-        folder_ids = {}
-        
-        for folder_name, config in structure.items():
-            # Create folder
-            folder_id = self.create_folder(
-                workspace_id,
-                folder_name,
-                parent_folder_id=parent_folder_id
-            )
-            folder_ids[folder_name] = folder_id
+        folder_ids: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+        
+        def create_all(jobs: List[Tuple[str, Optional[str]]]) -> None:
+            """Create (name, parent_id) folders concurrently, recording each outcome"""
+            futures = [
+                (name, executor.submit(
+                    self.create_folder, workspace_id, name, parent_folder_id=parent_id
+                ))
+                for name, parent_id in jobs
+            ]
+            for name, future in futures:
+                try:
+                    folder_ids[name] = future.result()
+                except Exception as e:
+                    errors[name] = e
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            # Sibling folders are independent, so create this level concurrently
+            create_all([(name, parent_folder_id) for name in structure])
             
-            # Create subfolders recursively
-            if isinstance(config, dict) and "subfolders" in config:
+            # Subfolders only need their own parent, so create them as one batch;
+            # those under a folder that failed are skipped
+            subfolder_jobs = []
+            for folder_name, config in structure.items():
+                if not (isinstance(config, dict) and "subfolders" in config):
+                    continue
                 for subfolder_name in config["subfolders"]:
-                    subfolder_structure = {subfolder_name: {}}
-                    sub_ids = self.create_folder_structure(
-                        workspace_id,
-                        subfolder_structure,
-                        parent_folder_id=folder_id
-                    )
-                    folder_ids.update(sub_ids)
+                    if folder_name in folder_ids:
+                        subfolder_jobs.append(
+                            (subfolder_name, folder_ids[folder_name])
+                        )
+                    else:
+                        errors[subfolder_name] = FolderOperationError(
+                            f"Parent folder '{folder_name}' was not created"
+                        )
+            create_all(subfolder_jobs)
+        
+        if errors:
+            failed = ", ".join(f"{name} ({error})" for name, error in errors.items())
+            error_msg = (
+                f"Created {len(folder_ids)} folder(s) but failed to create "
+                f"{len(errors)}: {failed}"
+            )
+            logger.error(error_msg)
+            raise FolderStructureError(error_msg, folder_ids, errors)
         
         return folder_ids
     
@@ -722,6 +800,22 @@ class FabricFolderManager:
             📁 Silver Layer
               📓 Transform_Notebook
         """
+        lines: List[str] = []
+        self._collect_folder_tree_lines(workspace_id, show_items, folder_id, prefix, lines)
+        
+        # Emit the whole tree in one call rather than one per folder/item
+        if lines:
+            print_info("\n".join(lines))
+    
+    def _collect_folder_tree_lines(
+        self,
+        workspace_id: str,
+        show_items: bool,
+        folder_id: Optional[str],
+        prefix: str,
+        lines: List[str]
+    ) -> None:
+        """Append the tree lines for one folder level (and below) to lines"""
         # Get folders at this level
         folders = self.list_folders(workspace_id, parent_folder_id=folder_id, include_subfolders=False)
         
@@ -729,19 +823,19 @@ class FabricFolderManager:
             is_last = (i == len(folders) - 1)
             connector = "└─" if is_last else "├─"
             
-            print_info(f"{prefix}{connector} 📁 {folder.display_name}")
+            lines.append(f"{prefix}{connector} 📁 {folder.display_name}")
             
             # Show items in folder if requested
             if show_items:
                 items = self.list_folder_items(workspace_id, folder.id)
+                item_connector = "  " if is_last else "│ "
                 for item in items:
-                    item_connector = "  " if is_last else "│ "
                     icon = self._get_item_icon(item["type"])
-                    print_info(f"{prefix}{item_connector}  {icon} {item['displayName']}")
+                    lines.append(f"{prefix}{item_connector}  {icon} {item['displayName']}")
             
-            # Recursively show subfolders
+            # Recursively collect subfolders
             new_prefix = prefix + ("  " if is_last else "│ ")
-            self.print_folder_tree(workspace_id, show_items, folder.id, new_prefix)
+            self._collect_folder_tree_lines(workspace_id, show_items, folder.id, new_prefix, lines)
     
     # ========================================================================
     # VALIDATION & UTILITY METHODS
@@ -29,6 +29,32 @@ class SecurityValidator:
         r"xp_cmdshell",
     ]
 
+    # Patterns are static, so compile them once at class creation
+    _SQL_INJECTION_RES = [
+        (pattern, re.compile(pattern, re.IGNORECASE))
+        for pattern in SQL_INJECTION_PATTERNS
+    ]
+    _SQL_LINE_COMMENT_RE = re.compile(r"--.*$", re.MULTILINE)
+    _SQL_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+    _EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    _DATASET_NAME_RE = re.compile(r"^(bronze|silver|gold|external)\.[a-z_][a-z0-9_]*$")
+    _UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]")
+    _WORKSPACE_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]{2,62}[a-zA-Z0-9]$")
+    _COLUMN_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]{0,127}$")
+    _SECRET_PATTERNS = {
+        "Azure Connection String": re.compile(
+            r"DefaultEndpointsProtocol=https;AccountName=", re.IGNORECASE
+        ),
+        "Private Key": re.compile(
+            r"-----BEGIN (RSA |EC |DSA )?PRIVATE KEY-----", re.IGNORECASE
+        ),
+        "AWS Access Key": re.compile(r"AKIA[0-9A-Z]{16}", re.IGNORECASE),
+        "Password in URL": re.compile(r"://[^:]+:[^@]+@", re.IGNORECASE),
+        "Generic Secret": re.compile(
+            r'(secret|password|key|token)\s*[:=]\s*["\'][^"\']+["\']', re.IGNORECASE
+        ),
+    }
+
     @staticmethod
     def validate_path_traversal(
         file_path: Union[str, Path], base_dir: Union[str, Path]
@@ -81,8 +107,8 @@ class SecurityValidator:
             ValueError: If potentially malicious patterns detected
         """
         # Check for dangerous patterns
-        for pattern in SecurityValidator.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, query, re.IGNORECASE):
+        for pattern, regex in SecurityValidator._SQL_INJECTION_RES:
+            if regex.search(query):
                 raise ValueError(
                     f"Potentially malicious SQL pattern detected: {pattern}"
                 )
@@ -90,9 +116,9 @@ class SecurityValidator:
         # Remove SQL comments if not allowed
         if not allow_comments:
             # Remove single-line comments
-            query = re.sub(r"--.*$", "", query, flags=re.MULTILINE)
+            query = SecurityValidator._SQL_LINE_COMMENT_RE.sub("", query)
             # Remove multi-line comments
-            query = re.sub(r"/\*.*?\*/", "", query, flags=re.DOTALL)
+            query = SecurityValidator._SQL_BLOCK_COMMENT_RE.sub("", query)
 
         return query.strip()
 
@@ -107,8 +133,7 @@ class SecurityValidator:
         Returns:
             True if valid email format, False otherwise
         """
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(email_pattern, email))
+        return bool(SecurityValidator._EMAIL_RE.match(email))
 
     @staticmethod
     def validate_dataset_name(dataset_name: str) -> bool:
@@ -122,8 +147,7 @@ class SecurityValidator:
             True if valid format, False otherwise
         """
         # Expected format: layer.entity_name
-        pattern = r"^(bronze|silver|gold|external)\.[a-z_][a-z0-9_]*$"
-        return bool(re.match(pattern, dataset_name))
+        return bool(SecurityValidator._DATASET_NAME_RE.match(dataset_name))
 
     @staticmethod
     def sanitize_filename(filename: str) -> str:
@@ -139,7 +163,7 @@ class SecurityValidator:
         # Remove path separators and special characters
         filename = os.path.basename(filename)
         # Allow only alphanumeric, dash, underscore, and period
-        filename = re.sub(r"[^a-zA-Z0-9._-]", "_", filename)
+        filename = SecurityValidator._UNSAFE_FILENAME_CHARS_RE.sub("_", filename)
         return filename
 
     @staticmethod
@@ -154,8 +178,7 @@ class SecurityValidator:
             True if valid format, False otherwise
         """
         # Workspace names should be alphanumeric with hyphens/underscores
-        pattern = r"^[a-zA-Z0-9][a-zA-Z0-9_-]{2,62}[a-zA-Z0-9]$"
-        return bool(re.match(pattern, workspace_name))
+        return bool(SecurityValidator._WORKSPACE_NAME_RE.match(workspace_name))
 
     @staticmethod
     def validate_column_name(column_name: str) -> bool:
@@ -169,8 +192,7 @@ class SecurityValidator:
             True if valid format, False otherwise
         """
         # Column names should be alphanumeric with underscores, starting with letter
-        pattern = r"^[a-zA-Z][a-zA-Z0-9_]{0,127}$"
-        return bool(re.match(pattern, column_name))
+        return bool(SecurityValidator._COLUMN_NAME_RE.match(column_name))
 
     @staticmethod
     def check_secrets_exposure(content: str) -> List[str]:
@@ -186,16 +208,8 @@ class SecurityValidator:
         issues = []
 
         # Check for common secret patterns
-        patterns = {
-            "Azure Connection String": r"DefaultEndpointsProtocol=https;AccountName=",
-            "Private Key": r"-----BEGIN (RSA |EC |DSA )?PRIVATE KEY-----",
-            "AWS Access Key": r"AKIA[0-9A-Z]{16}",
-            "Password in URL": r"://[^:]+:[^@]+@",
-            "Generic Secret": r'(secret|password|key|token)\s*[:=]\s*["\'][^"\']+["\']',
-        }
-
-        for issue_name, pattern in patterns.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for issue_name, regex in SecurityValidator._SECRET_PATTERNS.items():
+            if regex.search(content):
                 issues.append(f"Potential {issue_name} detected")
 
         return issues
@@ -10,10 +10,13 @@ FRAMEWORK REQUIREMENTS:
 
 import os
 import logging
+import random
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
 from msal import ConfidentialClientApplication
 
 from .constants import (
@@ -23,9 +26,12 @@ from .constants import (
     ERROR_MISSING_CREDENTIALS,
     ERROR_AUTHENTICATION_FAILED,
     HTTP_DEFAULT_TIMEOUT,
+    HTTP_POOL_SIZE,
+    TOKEN_EXPIRY_MARGIN_SECONDS,
     VALID_ENVIRONMENTS,
 )
 from .config_manager import get_config_manager
+from .fabric_api import invalidate_cached_workspace_id
 from .framework_validator import FrameworkValidator
 
 # Optional: Import audit logger
@@ -101,9 +107,19 @@ class WorkspaceManager:
         self.client_secret = os.getenv("AZURE_CLIENT_SECRET")
         self.base_url = FABRIC_API_BASE_URL
         self.token = None
+        self._token_expires_at = None
+        self._throttle_until = 0.0
+        self._throttle_lock = threading.Lock()
         self.environment = environment.lower() if environment else None
         self.max_retries = int(os.getenv("FABRIC_API_MAX_RETRIES", "3"))
 
+        # Shared keep-alive session so repeated calls reuse TCP/TLS connections
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE),
+        )
+
         # Initialize audit logger if available and enabled
         self.audit_logger = None
         if enable_audit_logging and AUDIT_LOGGER_AVAILABLE:
@@ -132,8 +148,10 @@ class WorkspaceManager:
         )
 
     def _get_access_token(self) -> str:
-        """Get Azure AD access token for Fabric API"""
-        if self.token:
+        """Get Azure AD access token for Fabric API (cached until near expiry)"""
+        if self.token and (
+            self._token_expires_at is None or time.time() < self._token_expires_at
+        ):
             return self.token
 
         app = ConfidentialClientApplication(
@@ -146,12 +164,38 @@ class WorkspaceManager:
 
         if "access_token" in result:
             self.token = result["access_token"]
+            expires_in = result.get("expires_in")
+            self._token_expires_at = (
+                time.time() + int(expires_in) - TOKEN_EXPIRY_MARGIN_SECONDS
+                if expires_in
+                else None
+            )
             logger.debug("Successfully acquired access token")
             return self.token
         else:
             error_desc = result.get("error_description", "Unknown error")
             raise Exception(ERROR_AUTHENTICATION_FAILED.format(error_desc))
 
+    def _wait_for_throttle(self) -> None:
+        """Block until any server-requested backoff (Retry-After) has elapsed"""
+        with self._throttle_lock:
+            delay = self._throttle_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _apply_throttle(self, seconds: float) -> None:
+        """Pause every request sharing this manager for the given duration"""
+        with self._throttle_lock:
+            self._throttle_until = max(
+                self._throttle_until, time.monotonic() + seconds
+            )
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter (half fixed, half random) per attempt"""
+        base = 2**attempt
+        return base / 2 + random.uniform(0, base / 2)
+
     def _make_request(
         self, method: str, endpoint: str, retry_count: int = None, **kwargs
     ) -> requests.Response:
@@ -183,15 +227,17 @@ class WorkspaceManager:
 
         for attempt in range(retry_count):
             try:
-                response = requests.request(method, url, **kwargs)
+                # Honour any Retry-After seen by concurrent callers too
+                self._wait_for_throttle()
+                response = self._session.request(method, url, **kwargs)
 
                 # Handle rate limiting (429)
-                if response.status_code == 429:
+                if response.status_code == 429 and attempt < retry_count - 1:
                     retry_after = int(response.headers.get("Retry-After", 60))
                     logger.warning(
                         f"Rate limited. Retrying after {retry_after} seconds..."
                     )
-                    time.sleep(retry_after)
+                    self._apply_throttle(retry_after)
                     continue
 
                 # Handle transient errors (500-503)
@@ -199,9 +245,10 @@ class WorkspaceManager:
                     response.status_code in [500, 502, 503]
                     and attempt < retry_count - 1
                 ):
-                    wait_time = 2**attempt  # Exponential backoff
+                    wait_time = self._backoff_delay(attempt)
                     logger.warning(
-                        f"Transient error {response.status_code}. Retrying in {wait_time}s..."
+                        f"Transient error {response.status_code}. "
+                        f"Retrying in {wait_time:.1f}s..."
                     )
                     time.sleep(wait_time)
                     continue
@@ -216,8 +263,10 @@ class WorkspaceManager:
 
             except requests.exceptions.RequestException as e:
                 if attempt < retry_count - 1:
-                    wait_time = 2**attempt
-                    logger.warning(f"Request failed: {e}. Retrying in {wait_time}s...")
+                    wait_time = self._backoff_delay(attempt)
+                    logger.warning(
+                        f"Request failed: {e}. Retrying in {wait_time:.1f}s..."
+                    )
                     time.sleep(wait_time)
                 else:
                     raise
@@ -526,6 +575,7 @@ class WorkspaceManager:
 
         try:
             self._make_request("DELETE", f"workspaces/{workspace_id}")
+            invalidate_cached_workspace_id(self.tenant_id, workspace_name, workspace_id)
             logger.info(f"✓ Deleted workspace: {workspace_name} (ID: {workspace_id})")
 
             # Log workspace deletion to audit trail
@@ -538,12 +588,73 @@ class WorkspaceManager:
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
+                invalidate_cached_workspace_id(
+                    self.tenant_id, workspace_name, workspace_id
+                )
                 logger.warning(f"Workspace {workspace_id} not found")
                 return False
             raise
 
+    def iter_workspace_pages(
+        self,
+        filter_by_environment: bool = True,
+        name_prefix: Optional[str] = None,
+        capacity_id: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield accessible workspaces one API page at a time
+
+        Follows continuationToken until the listing is exhausted, so callers
+        can start processing the first page before later pages arrive.
+
+        Args:
+            filter_by_environment: Only yield workspaces for current environment
+            name_prefix: Only yield workspaces whose name starts with this prefix
+            capacity_id: Only yield workspaces assigned to this capacity
+
+        Yields:
+            Lists of workspace objects, one per API page
+        """
+        # List Workspaces has no documented filter parameters, so filter locally
+        request_kwargs: Dict[str, Any] = {}
+        while True:
+            response = self._make_request("GET", "workspaces", **request_kwargs)
+            payload = response.json()
+            workspaces = payload.get("value", [])
+
+            if name_prefix:
+                workspaces = [
+                    ws
+                    for ws in workspaces
+                    if ws.get("displayName", "").startswith(name_prefix)
+                ]
+            if capacity_id:
+                workspaces = [
+                    ws for ws in workspaces if ws.get("capacityId") == capacity_id
+                ]
+
+            # Filter by environment if configured
+            if filter_by_environment and self.environment:
+                env_suffix = f"-{self.environment}"
+                workspaces = [
+                    ws
+                    for ws in workspaces
+                    if ws.get("displayName", "").endswith(env_suffix)
+                ]
+
+            yield workspaces
+
+            continuation_token = payload.get("continuationToken")
+            if not continuation_token:
+                return
+            request_kwargs = {"params": {"continuationToken": continuation_token}}
+
     def list_workspaces(
-        self, filter_by_environment: bool = True, include_details: bool = False
+        self,
+        filter_by_environment: bool = True,
+        include_details: bool = False,
+        name_prefix: Optional[str] = None,
+        capacity_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         List all accessible workspaces
@@ -551,21 +662,19 @@ class WorkspaceManager:
         Args:
             filter_by_environment: Only show workspaces for current environment
             include_details: Include detailed information for each workspace
+            name_prefix: Only show workspaces whose name starts with this prefix
+            capacity_id: Only show workspaces assigned to this capacity
 
         Returns:
             List of workspace objects
         """
-        response = self._make_request("GET", "workspaces")
-        workspaces = response.json().get("value", [])
-
-        # Filter by environment if configured
-        if filter_by_environment and self.environment:
-            env_suffix = f"-{self.environment}"
-            workspaces = [
-                ws
-                for ws in workspaces
-                if ws.get("displayName", "").endswith(env_suffix)
-            ]
+        workspaces = [
+            ws
+            for page in self.iter_workspace_pages(
+                filter_by_environment, name_prefix, capacity_id
+            )
+            for ws in page
+        ]
 
         # Add detailed info if requested
         if include_details:
@@ -431,7 +431,7 @@ class TestBulkOperations:
 class TestErrorHandling:
     """Test error handling and retry logic"""
 
-    @patch("ops.scripts.utilities.workspace_manager.requests.request")
+    @patch("ops.scripts.utilities.workspace_manager.requests.Session.request")
     @patch("ops.scripts.utilities.workspace_manager.WorkspaceManager._get_access_token")
     def test_retry_on_rate_limit(self, mock_token, mock_request, workspace_manager):
         """Test retry logic on rate limiting (429)"""
@@ -456,7 +456,7 @@ class TestErrorHandling:
         assert result.json()["id"] == "workspace-123"
         assert mock_request.call_count == 2
 
-    @patch("ops.scripts.utilities.workspace_manager.requests.request")
+    @patch("ops.scripts.utilities.workspace_manager.requests.Session.request")
     @patch("ops.scripts.utilities.workspace_manager.WorkspaceManager._get_access_token")
     def test_retry_on_transient_error(
         self, mock_token, mock_request, workspace_manager
@@ -251,6 +251,7 @@ fi
 
 echo "4. Install dependencies:"
 echo "   pip install -r ops/requirements.txt"
+echo "   python -m compileall -q ops tools  # optional: precompile bytecode for faster CLI start-up"
 
 echo "5. Run full validation (after installing dependencies):"
 echo "   python ops/scripts/validate_data_contracts.py --contracts-dir governance/data_contracts"
@@ -0,0 +1,160 @@
+"""
+Unit tests for the bulk workspace deletion tool
+
+Tests the deletion helpers including:
+- Per-workspace outcomes (deleted, not found, failed)
+- Summary totals
+- --all listing every target before any deletion
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add tools and ops/scripts to path
+REPO_ROOT = Path(__file__).parent.parent.parent
+for path in (REPO_ROOT / "tools", REPO_ROOT / "ops" / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import bulk_delete_workspaces as bulk
+from utilities import audit_logger
+from utilities.audit_logger import AuditLogger
+
+
+WS_DELETED = "8070ecd4-d1f2-4b08-addc-4a78adf2e1a4"
+WS_MISSING = "4f2a427d-9040-4bc6-b410-cbeb8e7c7bf4"
+WS_FAILING = "e5ca7fe9-e1f2-470b-97aa-5723ffef40de"
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def audit_file(tmp_path, monkeypatch):
+    """Send AuditLogger output to tmp_path instead of audit/ in the repo"""
+    path = tmp_path / "audit_trail.jsonl"
+    monkeypatch.setattr(
+        audit_logger, "_global_audit_logger", AuditLogger(audit_file=path)
+    )
+    return path
+
+
+@pytest.fixture
+def manager():
+    """Mock WorkspaceManager: one deletable, one missing, one failing workspace"""
+    def delete_workspace(workspace_id, force=False):
+        if workspace_id == WS_FAILING:
+            raise RuntimeError("boom")
+        return workspace_id != WS_MISSING
+
+    mock_manager = Mock()
+    mock_manager.delete_workspace.side_effect = delete_workspace
+    return mock_manager
+
+
+# ============================================================================
+# DELETE TESTS
+# ============================================================================
+
+class TestDeleteWorkspaces:
+    """Test per-workspace outcomes of delete_workspaces"""
+
+    def test_outcomes(self, manager):
+        results = asyncio.run(
+            bulk.delete_workspaces(manager, [WS_DELETED, WS_MISSING, WS_FAILING])
+        )
+
+        assert [outcome for outcome, _ in results] == [
+            bulk.DELETED,
+            bulk.NOT_FOUND,
+            bulk.FAILED,
+        ]
+        manager.delete_workspace.assert_any_call(WS_DELETED, force=True)
+
+    def test_false_return_is_not_reported_as_deleted(self, manager):
+        [(outcome, line)] = asyncio.run(bulk.delete_workspaces(manager, [WS_MISSING]))
+
+        assert outcome == bulk.NOT_FOUND
+        assert "Deleted" not in line
+        assert WS_MISSING in line
+
+
+class TestPrintSummary:
+    """Test the summary totals"""
+
+    def test_counts_each_outcome(self, manager, capsys):
+        results = asyncio.run(
+            bulk.delete_workspaces(manager, [WS_DELETED, WS_MISSING, WS_FAILING])
+        )
+
+        bulk.print_summary(results)
+
+        out = capsys.readouterr().out
+        assert "✅ Deleted: 1" in out
+        assert "Not found: 1" in out
+        assert "❌ Failed: 1" in out
+        assert "📋 Total: 3" in out
+
+
+class TestDeleteAll:
+    """Test --all: the full listing is printed and fetched before deleting"""
+
+    @pytest.fixture
+    def listed_manager(self, manager):
+        calls = []
+        workspaces = [
+            {"id": WS_DELETED, "displayName": "Sales"},
+            {"id": WS_FAILING, "displayName": "Finance"},
+            {"id": WS_MISSING, "displayName": "Marketing"},
+        ]
+
+        def list_workspaces(**filters):
+            calls.append("list")
+            return workspaces
+
+        delete = manager.delete_workspace.side_effect
+
+        def delete_workspace(workspace_id, force=False):
+            calls.append("delete")
+            return delete(workspace_id, force=force)
+
+        manager.list_workspaces.side_effect = list_workspaces
+        manager.delete_workspace.side_effect = delete_workspace
+        manager.calls = calls
+        return manager
+
+    def test_lists_before_deleting(self, listed_manager, capsys):
+        with patch.object(bulk, "WorkspaceManager", return_value=listed_manager):
+            bulk.main(["--all", "--yes"])
+
+        assert listed_manager.calls == ["list", "delete", "delete", "delete"]
+        out = capsys.readouterr().out
+        for name in ("Sales", "Finance", "Marketing"):
+            assert out.index(name) < out.index("Deleting 3 workspace(s)")
+
+    def test_failure_does_not_stop_other_deletes(self, listed_manager, capsys):
+        with patch.object(bulk, "WorkspaceManager", return_value=listed_manager):
+            bulk.main(["--all", "--yes", "--concurrency", "1"])
+
+        assert listed_manager.delete_workspace.call_count == 3
+        out = capsys.readouterr().out
+        assert "✅ Deleted: 1" in out
+        assert "❌ Failed: 1" in out
+
+    def test_filters_forwarded_to_listing(self, listed_manager):
+        with patch.object(bulk, "WorkspaceManager", return_value=listed_manager):
+            bulk.main(["--all", "--yes", "--filter-prefix", "Sa"])
+
+        listed_manager.list_workspaces.assert_called_once_with(name_prefix="Sa")
+
+    def test_dry_run_deletes_nothing(self, listed_manager, capsys):
+        with patch.object(bulk, "WorkspaceManager", return_value=listed_manager):
+            bulk.main(["--all", "--yes", "--dry-run"])
+
+        listed_manager.delete_workspace.assert_not_called()
+        assert "Marketing" in capsys.readouterr().out
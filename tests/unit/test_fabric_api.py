@@ -0,0 +1,184 @@
+"""
+Unit tests for the Fabric API client
+
+Tests the workspace name -> ID cache including:
+- Disk cache reuse across lookups
+- Eviction on workspace 404s (not sub-resource 404s) and explicit invalidation
+"""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ops.scripts.utilities import fabric_api
+from ops.scripts.utilities.fabric_api import (
+    FabricClient,
+    invalidate_cached_workspace_id,
+)
+
+
+TENANT = "tenant-1"
+WS_ID = "8070ecd4-d1f2-4b08-addc-4a78adf2e1a4"
+OTHER_ID = "4f2a427d-9040-4bc6-b410-cbeb8e7c7bf4"
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the workspace ID cache at a temporary file"""
+    path = tmp_path / "workspace_ids.json"
+    monkeypatch.setattr(fabric_api, "WORKSPACE_ID_CACHE_FILE", str(path))
+    monkeypatch.setattr(fabric_api, "ENABLE_CACHING", True)
+    FabricClient.get_workspace_id.cache_clear()
+    yield path
+    FabricClient.get_workspace_id.cache_clear()
+
+
+@pytest.fixture
+def client():
+    """FabricClient that doesn't require credentials"""
+    fabric_client = FabricClient(skip_auth_check=True)
+    fabric_client.tenant_id = TENANT
+    fabric_client.token = "token"
+    return fabric_client
+
+
+def _response(status_code=200, payload=None):
+    response = Mock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.json.return_value = payload or {}
+    response.raise_for_status.side_effect = (
+        Exception(f"HTTP {status_code}") if status_code >= 400 else None
+    )
+    return response
+
+
+def _write_cache(path, entries):
+    now = time.time()
+    path.write_text(
+        json.dumps(
+            {
+                f"{TENANT}:{name}": {"id": ws_id, "cached_at": now}
+                for name, ws_id in entries.items()
+            }
+        )
+    )
+
+
+def _read_cache(path):
+    return json.loads(path.read_text())
+
+
+# ============================================================================
+# CACHE TESTS
+# ============================================================================
+
+class TestGetWorkspaceId:
+    """Test name -> ID resolution through the disk cache"""
+
+    def test_listing_populates_cache(self, client, cache_file):
+        listing = {"value": [{"displayName": "Sales", "id": WS_ID}]}
+        response = _response(payload=listing)
+        with patch.object(fabric_api.requests, "request", return_value=response):
+            assert client.get_workspace_id("Sales") == WS_ID
+
+        assert _read_cache(cache_file)[f"{TENANT}:Sales"]["id"] == WS_ID
+
+    def test_uses_fresh_disk_entry(self, client, cache_file):
+        _write_cache(cache_file, {"Sales": WS_ID})
+
+        with patch.object(fabric_api.requests, "request") as mock_request:
+            assert client.get_workspace_id("Sales") == WS_ID
+
+        mock_request.assert_not_called()
+
+
+class TestInvalidateWorkspaceId:
+    """Test eviction of stale workspace IDs"""
+
+    def test_evicts_by_name(self, cache_file):
+        _write_cache(cache_file, {"Sales": WS_ID, "Finance": OTHER_ID})
+
+        invalidate_cached_workspace_id(TENANT, workspace_name="Sales")
+
+        assert list(_read_cache(cache_file)) == [f"{TENANT}:Finance"]
+
+    def test_evicts_by_id(self, cache_file):
+        _write_cache(cache_file, {"Sales": WS_ID, "Finance": OTHER_ID})
+
+        invalidate_cached_workspace_id(TENANT, workspace_id=WS_ID)
+
+        assert list(_read_cache(cache_file)) == [f"{TENANT}:Finance"]
+
+    def test_ignores_other_tenants(self, cache_file):
+        _write_cache(cache_file, {"Sales": WS_ID})
+
+        invalidate_cached_workspace_id("tenant-2", workspace_id=WS_ID)
+
+        assert f"{TENANT}:Sales" in _read_cache(cache_file)
+
+    def test_missing_cache_file(self, cache_file):
+        invalidate_cached_workspace_id(TENANT, workspace_name="Sales")
+
+        assert not cache_file.exists()
+
+    def test_clears_in_process_cache(self, client, cache_file):
+        _write_cache(cache_file, {"Sales": WS_ID})
+        assert client.get_workspace_id("Sales") == WS_ID
+
+        client._invalidate_workspace_id(workspace_name="Sales")
+
+        listing = {"value": [{"displayName": "Sales", "id": OTHER_ID}]}
+        response = _response(payload=listing)
+        with patch.object(fabric_api.requests, "request", return_value=response):
+            assert client.get_workspace_id("Sales") == OTHER_ID
+
+    @pytest.mark.parametrize(
+        "endpoint", [f"workspaces/{WS_ID}", f"/workspaces/{WS_ID}/"]
+    )
+    def test_404_on_workspace_evicts(self, client, cache_file, endpoint):
+        _write_cache(cache_file, {"Sales": WS_ID, "Finance": OTHER_ID})
+
+        response = _response(404)
+        with patch.object(fabric_api.requests, "request", return_value=response):
+            with pytest.raises(Exception):
+                client._make_request("GET", endpoint)
+
+        assert list(_read_cache(cache_file)) == [f"{TENANT}:Finance"]
+
+    def test_workspace_not_found_on_sub_resource_evicts(self, client, cache_file):
+        _write_cache(cache_file, {"Sales": WS_ID, "Finance": OTHER_ID})
+
+        response = _response(404, {"errorCode": "WorkspaceNotFound"})
+        with patch.object(fabric_api.requests, "request", return_value=response):
+            with pytest.raises(Exception):
+                client.list_workspace_items(WS_ID)
+
+        assert list(_read_cache(cache_file)) == [f"{TENANT}:Finance"]
+
+    @pytest.mark.parametrize("endpoint", [
+        f"workspaces/{WS_ID}/items/item-1",
+        f"workspaces/{WS_ID}/folders/folder-1",
+        f"workspaces/{WS_ID}/bulkMoveItems",
+    ])
+    def test_404_on_sub_resource_keeps_cache(self, client, cache_file, endpoint):
+        _write_cache(cache_file, {"Sales": WS_ID})
+        assert client.get_workspace_id("Sales") == WS_ID
+
+        response = _response(404, {"errorCode": "ItemNotFound"})
+        with patch.object(fabric_api.requests, "request", return_value=response):
+            with pytest.raises(Exception):
+                client._make_request("GET", endpoint)
+
+        assert _read_cache(cache_file)[f"{TENANT}:Sales"]["id"] == WS_ID
+        # The in-process cache is intact too, so no listing is needed
+        with patch.object(fabric_api.requests, "request") as mock_request:
+            assert client.get_workspace_id("Sales") == WS_ID
+        assert FabricClient.get_workspace_id.cache_info().hits == 1
+        mock_request.assert_not_called()
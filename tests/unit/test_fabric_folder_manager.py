@@ -10,6 +10,7 @@ Tests the folder management functionality including:
 """
 
 import pytest
+import requests
 from unittest.mock import Mock, patch, MagicMock, call
 from ops.scripts.utilities.fabric_folder_manager import (
     FabricFolderManager,
@@ -17,6 +18,7 @@ from ops.scripts.utilities.fabric_folder_manager import (
     FolderStructure,
     FolderValidationError,
     FolderOperationError,
+    FolderStructureError,
 )
 
 
@@ -504,6 +506,80 @@ class TestMoveItemsToFolder:
         assert results["item1"] is True
         assert results["item2"] is False
         assert results["item3"] is True
+    
+    def test_bulk_move_missing_results_count_as_failed(self, manager, mock_fabric_client):
+        """Test that items absent from the bulk response are reported as failed"""
+        mock_fabric_client._make_request.return_value = Mock(json=lambda: {
+            "results": [
+                {"itemId": "item1", "status": "Success"},
+                {"itemId": "item2", "status": "Failed"},
+            ]
+        })
+        
+        results = manager.move_items_to_folder(
+            "workspace1", ["item1", "item2", "item3"], "folder1"
+        )
+        
+        assert results == {"item1": True, "item2": False, "item3": False}
+        mock_fabric_client._make_request.assert_called_once_with(
+            "POST",
+            "workspaces/workspace1/bulkMoveItems",
+            json={"targetFolderId": "folder1", "itemIds": ["item1", "item2", "item3"]},
+        )
+    
+    def test_bulk_move_404_falls_back_to_per_item_moves(self, manager, mock_fabric_client):
+        """Test per-item moves when the bulk endpoint is unavailable"""
+        def make_request(method, endpoint, **kwargs):
+            if endpoint.endswith("/bulkMoveItems"):
+                raise requests.exceptions.HTTPError(response=Mock(status_code=404))
+            return Mock(status_code=200)
+        
+        mock_fabric_client._make_request.side_effect = make_request
+        
+        results = manager.move_items_to_folder(
+            "workspace1", ["item1", "item2"], "folder1"
+        )
+        
+        assert results == {"item1": True, "item2": True}
+        endpoints = {c.args[1] for c in mock_fabric_client._make_request.call_args_list}
+        assert endpoints == {
+            "workspaces/workspace1/bulkMoveItems",
+            "workspaces/workspace1/items/item1/move",
+            "workspaces/workspace1/items/item2/move",
+        }
+    
+    def test_per_item_fallback_partial_failure(self, manager, mock_fabric_client):
+        """Test that a failing per-item move is reported without stopping the others"""
+        def make_request(method, endpoint, **kwargs):
+            if endpoint.endswith("/bulkMoveItems"):
+                raise requests.exceptions.HTTPError(response=Mock(status_code=404))
+            if endpoint.endswith("/item2/move"):
+                raise Exception("API Error")
+            return Mock(status_code=200)
+        
+        mock_fabric_client._make_request.side_effect = make_request
+        
+        results = manager.move_items_to_folder(
+            "workspace1", ["item1", "item2", "item3"], None
+        )
+        
+        assert results == {"item1": True, "item2": False, "item3": True}
+        mock_fabric_client._make_request.assert_any_call(
+            "POST",
+            "workspaces/workspace1/items/item3/move",
+            json={"targetFolderId": None},
+        )
+    
+    def test_bulk_move_other_http_error_raises(self, manager, mock_fabric_client):
+        """Test that non-404 bulk move errors are not retried per item"""
+        mock_fabric_client._make_request.side_effect = requests.exceptions.HTTPError(
+            response=Mock(status_code=500)
+        )
+        
+        with pytest.raises(FolderOperationError, match="Failed to move items"):
+            manager.move_items_to_folder("workspace1", ["item1"], "folder1")
+        
+        assert mock_fabric_client._make_request.call_count == 1
 
 
 # ============================================================================
@@ -596,6 +672,48 @@ class TestCreateFolderStructure:
         assert "Parent" in folder_ids
         assert "Parent/Child1" in folder_ids
         assert "Parent/Child2" in folder_ids
+    
+    def test_partial_failure_creates_remaining_folders(self, manager):
+        """Test that one failing folder doesn't stop its siblings or their subfolders"""
+        structure = {
+            "Bronze": {"subfolders": ["Raw", "Archive"]},
+            "Silver": {"subfolders": ["Cleaned"]},
+            "Gold": {},
+        }
+        
+        def create_folder(workspace_id, name, parent_folder_id=None):
+            if name in ("Silver", "Archive"):
+                raise FolderOperationError(f"{name} failed")
+            return f"{name.lower()}-id"
+        
+        with patch.object(manager, 'create_folder', side_effect=create_folder) as mock_create:
+            with pytest.raises(FolderStructureError) as exc_info:
+                manager.create_folder_structure("workspace1", structure)
+        
+        error = exc_info.value
+        assert error.folder_ids == {
+            "Bronze": "bronze-id",
+            "Gold": "gold-id",
+            "Raw": "raw-id",
+        }
+        assert set(error.errors) == {"Silver", "Archive", "Cleaned"}
+        assert isinstance(error, FolderOperationError)
+        
+        # Subfolders of the failed parent are never attempted
+        created_names = {c.args[1] for c in mock_create.call_args_list}
+        assert created_names == {"Bronze", "Silver", "Gold", "Raw", "Archive"}
+        mock_create.assert_any_call("workspace1", "Raw", parent_folder_id="bronze-id")
+    
+    def test_all_folders_fail(self, manager):
+        """Test that a structure with no successful folders reports every error"""
+        structure = {"Folder1": {}, "Folder2": {}}
+        
+        with patch.object(manager, 'create_folder', side_effect=FolderOperationError("boom")):
+            with pytest.raises(FolderStructureError) as exc_info:
+                manager.create_folder_structure("workspace1", structure)
+        
+        assert exc_info.value.folder_ids == {}
+        assert set(exc_info.value.errors) == {"Folder1", "Folder2"}
 
 
 class TestPrintFolderTree:
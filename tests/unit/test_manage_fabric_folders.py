@@ -0,0 +1,49 @@
+"""
+Unit tests for the Fabric folder management CLI
+
+Tests the CLI helpers including:
+- JSON output of folder IDs (orjson and stdlib fallback)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools to path
+TOOLS_PATH = Path(__file__).parent.parent.parent / "tools"
+if str(TOOLS_PATH) not in sys.path:
+    sys.path.insert(0, str(TOOLS_PATH))
+
+import manage_fabric_folders as cli
+
+
+FOLDER_IDS = {"Données Brutes": "folder-1", "Gold 🥇": "folder-2"}
+
+
+class TestWriteJson:
+    """Test that both JSON writers produce the same UTF-8 output"""
+
+    def test_fallback_writes_raw_utf8(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "orjson", None)
+        path = tmp_path / "ids.json"
+
+        cli._write_json(FOLDER_IDS, str(path))
+
+        text = path.read_bytes().decode("utf-8")
+        assert "Données Brutes" in text
+        assert "\\u" not in text
+        assert json.loads(text) == FOLDER_IDS
+
+    def test_fallback_matches_orjson(self, tmp_path, monkeypatch):
+        if cli.orjson is None:
+            pytest.skip("orjson not installed")
+        orjson_path = tmp_path / "orjson.json"
+        fallback_path = tmp_path / "fallback.json"
+
+        cli._write_json(FOLDER_IDS, str(orjson_path))
+        monkeypatch.setattr(cli, "orjson", None)
+        cli._write_json(FOLDER_IDS, str(fallback_path))
+
+        assert fallback_path.read_bytes() == orjson_path.read_bytes()
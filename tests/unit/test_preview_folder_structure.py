@@ -0,0 +1,193 @@
+"""
+Unit tests for the credential-free folder structure preview tool
+
+Tests the preview CLI including:
+- Flag handling before and after the 'preview' subcommand
+- Output encoding for wrapped stdout streams
+- Intelligent item placement (classify)
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools to path
+TOOLS_PATH = Path(__file__).parent.parent.parent / "tools"
+if str(TOOLS_PATH) not in sys.path:
+    sys.path.insert(0, str(TOOLS_PATH))
+
+import preview_folder_structure as preview
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def extra_template(monkeypatch):
+    """Register a second template so --template values are distinguishable"""
+    templates = dict(preview.TEMPLATES, other=preview.MEDALLION_STRUCTURE)
+    monkeypatch.setattr(preview, "TEMPLATES", templates)
+    monkeypatch.setattr(preview, "_TEMPLATE_CHOICES", tuple(templates))
+    preview._render_structure.cache_clear()
+    yield "other"
+    preview._render_structure.cache_clear()
+
+
+# ============================================================================
+# CLI TESTS
+# ============================================================================
+
+class TestMainArguments:
+    """Test that preview flags apply wherever they appear on the command line"""
+
+    @pytest.mark.parametrize("argv", [
+        ["--show-placement"],
+        ["--show-placement", "preview"],
+        ["preview", "--show-placement"],
+    ])
+    def test_show_placement(self, argv, capsys):
+        preview.main(argv)
+
+        assert "Intelligent Item Placement Rules" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("argv", [[], ["preview"]])
+    def test_show_placement_off_by_default(self, argv, capsys):
+        preview.main(argv)
+
+        assert "Intelligent Item Placement Rules" not in capsys.readouterr().out
+
+    @pytest.mark.parametrize("argv", [
+        ["--template", "other"],
+        ["--template", "other", "preview"],
+        ["preview", "--template", "other"],
+    ])
+    def test_template(self, argv, extra_template, capsys):
+        preview.main(argv)
+
+        assert "--template other" in capsys.readouterr().out
+
+    def test_template_defaults_to_medallion(self, extra_template, capsys):
+        preview.main(["preview"])
+
+        assert "--template medallion" in capsys.readouterr().out
+
+    def test_placement_subcommand(self, capsys):
+        preview.main(["placement"])
+
+        out = capsys.readouterr().out
+        assert "Intelligent Item Placement Rules" in out
+        assert "DRY RUN" not in out
+
+
+# ============================================================================
+# OUTPUT TESTS
+# ============================================================================
+
+class _WrappedStream:
+    """Text stream exposing a byte buffer, as stdout wrappers often do"""
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+        self.buffer = io.BytesIO()
+        self.text = io.StringIO()
+
+    def write(self, text):
+        return self.text.write(text)
+
+    def flush(self):
+        pass
+
+
+class TestEmit:
+    """Test that _emit picks the byte or text layer safely"""
+
+    @pytest.mark.parametrize("encoding", [None, ""])
+    def test_stream_without_encoding_uses_text_layer(self, encoding, monkeypatch):
+        stream = _WrappedStream(encoding)
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        preview._emit("✅ done\n")
+
+        assert stream.text.getvalue() == "✅ done\n"
+        assert stream.buffer.getvalue() == b""
+
+    def test_utf8_stream_writes_bytes(self, monkeypatch):
+        stream = _WrappedStream("UTF8")
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        preview._emit("✅ done\n")
+
+        assert stream.buffer.getvalue() == "✅ done\n".encode("utf-8")
+        assert stream.text.getvalue() == ""
+
+    def test_non_utf8_stream_uses_text_layer(self, monkeypatch):
+        stream = _WrappedStream("latin-1")
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        preview._emit("done\n")
+
+        assert stream.text.getvalue() == "done\n"
+
+
+# ============================================================================
+# PLACEMENT TESTS
+# ============================================================================
+
+class TestClassify:
+    """Test item name -> target folder placement"""
+
+    @pytest.mark.parametrize("name, folder", [
+        ("BRONZE_SalesData_Lakehouse", "Bronze Layer/Raw Data"),
+        ("SILVER_Cleaned_Lakehouse", "Silver Layer/Cleaned"),
+        ("GOLD_Analytics_Lakehouse", "Gold Layer/Analytics"),
+    ])
+    def test_layer_prefixes(self, name, folder):
+        assert preview.classify(name) == folder
+
+    @pytest.mark.parametrize(
+        "name", ["bronze_Data", "Bronze_Data", "XBRONZE_Data", "BRONZE"]
+    )
+    def test_prefix_must_match_exactly_at_start(self, name):
+        assert preview.classify(name) is None
+
+    @pytest.mark.parametrize("number, folder", [
+        ("01", "Bronze Layer/Raw Data"),
+        ("09", "Bronze Layer/Raw Data"),
+        ("10", "Silver Layer/Transformed"),
+        ("19", "Silver Layer/Transformed"),
+        ("20", "Gold Layer/Analytics"),
+        ("29", "Gold Layer/Analytics"),
+        ("50", "Workspace Root"),
+        ("99", "Workspace Root"),
+    ])
+    def test_numeric_buckets(self, number, folder):
+        assert preview.classify(f"{number}_Notebook") == folder
+
+    @pytest.mark.parametrize("number", ["00", "30", "42", "49"])
+    def test_unassigned_numbers(self, number):
+        assert preview.classify(f"{number}_Notebook") is None
+
+    @pytest.mark.parametrize(
+        "name", ["\u0661\u0662_Notebook", "\uff11\uff10_Notebook", "1\u00b2_Notebook"]
+    )
+    def test_non_ascii_digits_are_not_numbers(self, name):
+        assert preview._num_prefix(name) is None
+        assert preview.classify(name) is None
+
+    @pytest.mark.parametrize("name", ["", "0", "01", "1_", "GO"])
+    def test_short_names(self, name):
+        assert preview.classify(name) is None
+
+    @pytest.mark.parametrize("name", ["1_Notebook", "001_Notebook", "10Notebook"])
+    def test_number_prefix_needs_two_digits_and_underscore(self, name):
+        assert preview.classify(name) is None
+
+    def test_examples_follow_the_rules(self, capsys):
+        preview.main(["placement"])
+
+        out = capsys.readouterr().out
+        for name in preview._EXAMPLE_ITEMS:
+            assert f"{name.ljust(27)} → {preview.classify(name)}" in out
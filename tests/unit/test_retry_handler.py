@@ -9,11 +9,15 @@ from unittest.mock import Mock, patch, MagicMock
 import requests
 
 
+@pytest.fixture(scope="session")
+def _baseline_env():
+    """Snapshot of the environment taken once per test session"""
+    return dict(os.environ)
+
+
 @pytest.fixture
-def clean_env():
+def clean_env(_baseline_env):
     """Clean environment before each test"""
-    original_env = os.environ.copy()
-
     # Clear feature flags
     for key in ["FEATURE_USE_RETRY_LOGIC"]:
         if key in os.environ:
@@ -21,9 +25,12 @@ def clean_env():
 
     yield
 
-    # Restore original env
-    os.environ.clear()
-    os.environ.update(original_env)
+    # Restore only the keys that changed relative to the session baseline
+    for key in set(os.environ) - set(_baseline_env):
+        os.environ.pop(key, None)
+    for key, value in _baseline_env.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
 
 
 def test_retry_disabled_by_default(clean_env):
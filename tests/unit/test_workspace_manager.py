@@ -0,0 +1,201 @@
+"""
+Unit tests for Microsoft Fabric Workspace Manager
+
+Tests the workspace manager including:
+- Workspace deletion and workspace ID cache invalidation
+- Paged workspace listing (continuationToken)
+- Request retries (429 Retry-After, jittered backoff)
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ops.scripts.utilities import audit_logger
+from ops.scripts.utilities import workspace_manager as wm_module
+from ops.scripts.utilities.audit_logger import AuditLogger
+from ops.scripts.utilities.workspace_manager import WorkspaceManager
+
+
+WS_ID = "8070ecd4-d1f2-4b08-addc-4a78adf2e1a4"
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def audit_file(tmp_path, monkeypatch):
+    """Send AuditLogger output to tmp_path instead of audit/ in the repo"""
+    path = tmp_path / "audit_trail.jsonl"
+    monkeypatch.setattr(
+        audit_logger, "_global_audit_logger", AuditLogger(audit_file=path)
+    )
+    return path
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """WorkspaceManager that doesn't require credentials or config files"""
+    monkeypatch.setenv("AZURE_TENANT_ID", "tenant-1")
+    monkeypatch.setenv("AZURE_CLIENT_ID", "client-1")
+    monkeypatch.setenv("AZURE_CLIENT_SECRET", "secret")
+    monkeypatch.setattr(wm_module, "FOLDER_MANAGER_AVAILABLE", False)
+    with patch.object(wm_module, "get_config_manager"):
+        workspace_manager = WorkspaceManager(skip_framework_validation=True)
+    workspace_manager.token = "token"
+    return workspace_manager
+
+
+def _page(workspaces, continuation_token=None):
+    payload = {"value": workspaces}
+    if continuation_token:
+        payload["continuationToken"] = continuation_token
+    response = Mock()
+    response.json.return_value = payload
+    return response
+
+
+def _http_error(status_code):
+    response = Mock(status_code=status_code)
+    return wm_module.requests.exceptions.HTTPError(response=response)
+
+
+# ============================================================================
+# DELETE TESTS
+# ============================================================================
+
+class TestDeleteWorkspace:
+    """Test that deletions evict the workspace from the name -> ID cache"""
+
+    def test_delete_invalidates_cached_id(self, manager):
+        with patch.object(manager, "get_workspace_details") as mock_details, \
+                patch.object(manager, "_make_request"), \
+                patch.object(wm_module, "invalidate_cached_workspace_id") as mock_evict:
+            mock_details.return_value = {"displayName": "Sales"}
+
+            assert manager.delete_workspace(WS_ID, force=True) is True
+
+        mock_evict.assert_called_once_with("tenant-1", "Sales", WS_ID)
+
+    def test_delete_is_audited_to_tmp_path(self, manager, audit_file):
+        with patch.object(manager, "get_workspace_details") as mock_details, \
+                patch.object(manager, "_make_request"), \
+                patch.object(wm_module, "invalidate_cached_workspace_id"):
+            mock_details.return_value = {"displayName": "Sales"}
+
+            manager.delete_workspace(WS_ID, force=True)
+
+        assert WS_ID in audit_file.read_text()
+
+    def test_delete_not_found_invalidates_cached_id(self, manager):
+        with patch.object(manager, "get_workspace_details") as mock_details, \
+                patch.object(manager, "_make_request") as mock_request, \
+                patch.object(wm_module, "invalidate_cached_workspace_id") as mock_evict:
+            mock_details.return_value = {"displayName": "Sales"}
+            mock_request.side_effect = _http_error(404)
+
+            assert manager.delete_workspace(WS_ID, force=True) is False
+
+        mock_evict.assert_called_once_with("tenant-1", "Sales", WS_ID)
+
+
+# ============================================================================
+# LISTING TESTS
+# ============================================================================
+
+class TestListWorkspaces:
+    """Test that listings follow continuationToken across pages"""
+
+    @pytest.fixture
+    def paged_request(self, manager):
+        pages = [
+            _page([{"id": "1", "displayName": "Sales"}], "token-2"),
+            _page([{"id": "2", "displayName": "Finance"}], "token-3"),
+            _page([{"id": "3", "displayName": "Marketing"}]),
+        ]
+        with patch.object(manager, "_make_request", side_effect=pages) as mock_request:
+            yield mock_request
+
+    def test_iter_pages_follows_continuation_token(self, manager, paged_request):
+        pages = list(manager.iter_workspace_pages())
+
+        assert [[ws["id"] for ws in page] for page in pages] == [["1"], ["2"], ["3"]]
+        tokens = [
+            call.kwargs.get("params", {}).get("continuationToken")
+            for call in paged_request.call_args_list
+        ]
+        assert tokens == [None, "token-2", "token-3"]
+
+    def test_list_workspaces_flattens_pages(self, manager, paged_request):
+        workspaces = manager.list_workspaces()
+
+        assert [ws["id"] for ws in workspaces] == ["1", "2", "3"]
+
+    def test_name_prefix_filters_every_page(self, manager, paged_request):
+        workspaces = manager.list_workspaces(name_prefix="Fin")
+
+        assert [ws["id"] for ws in workspaces] == ["2"]
+        assert paged_request.call_count == 3
+
+    def test_filters_are_not_sent_to_the_api(self, manager, paged_request):
+        manager.list_workspaces(name_prefix="Fin", capacity_id="cap-1")
+
+        for call in paged_request.call_args_list:
+            assert set(call.kwargs.get("params", {})) <= {"continuationToken"}
+
+
+# ============================================================================
+# RETRY TESTS
+# ============================================================================
+
+def _response(status_code, headers=None):
+    response = Mock(status_code=status_code, headers=headers or {})
+    response.ok = status_code < 400
+    if not response.ok:
+        response.raise_for_status.side_effect = _http_error(status_code)
+    return response
+
+
+class TestMakeRequest:
+    """Test retry handling in _make_request"""
+
+    @pytest.fixture
+    def no_sleep(self):
+        with patch.object(wm_module.time, "sleep") as mock_sleep:
+            yield mock_sleep
+
+    def test_429_retries_after_throttle(self, manager, no_sleep):
+        responses = [_response(429, {"Retry-After": "2"}), _response(200)]
+        with patch.object(manager._session, "request", side_effect=responses), \
+                patch.object(manager, "_apply_throttle") as mock_throttle:
+            assert manager._make_request("GET", "workspaces").status_code == 200
+
+        mock_throttle.assert_called_once_with(2)
+
+    def test_429_on_final_attempt_raises_without_waiting(self, manager, no_sleep):
+        responses = [_response(429, {"Retry-After": "30"})] * 2
+        with patch.object(manager._session, "request", side_effect=responses), \
+                patch.object(manager, "_apply_throttle") as mock_throttle:
+            with pytest.raises(wm_module.requests.exceptions.HTTPError) as exc_info:
+                manager._make_request("GET", "workspaces", retry_count=2)
+
+        assert exc_info.value.response.status_code == 429
+        # Only the first 429 schedules a wait; the last one is raised directly
+        mock_throttle.assert_called_once_with(30)
+
+    def test_transient_error_backoff_is_jittered(self, manager, no_sleep):
+        responses = [_response(503), _response(503), _response(200)]
+        with patch.object(manager._session, "request", side_effect=responses), \
+                patch.object(wm_module.random, "uniform") as mock_uniform:
+            mock_uniform.return_value = 0.25
+            manager._make_request("GET", "workspaces", retry_count=3)
+
+        assert [c.args for c in mock_uniform.call_args_list] == [(0, 0.5), (0, 1.0)]
+        assert [c.args[0] for c in no_sleep.call_args_list] == [0.75, 1.25]
+
+    @pytest.mark.parametrize("attempt", [0, 1, 2, 3])
+    def test_backoff_delay_bounds(self, attempt):
+        delay = WorkspaceManager._backoff_delay(attempt)
+
+        assert 2**attempt / 2 <= delay <= 2**attempt
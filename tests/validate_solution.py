@@ -4,10 +4,81 @@ Quick validation test for Fabric CI/CD solution
 Tests core functionality without requiring credentials
 """
 
+import importlib
+import os
 import sys
 import yaml
 import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from os.path import isdir, isfile
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Add ops directory to Python path once, at module load
+if "ops" not in sys.path:
+    sys.path.insert(0, "ops")
+
+
+# Top-level keys every data contract and the CI/CD workflow must define
+_CONTRACT_REQUIRED = frozenset(("dataset", "owner", "version"))
+_WORKFLOW_REQUIRED = frozenset(("name", "on", "jobs"))
+
+# Directories walked once to answer file-existence checks (root is not recursed)
+_SCANNED_DIRS = ("governance", ".github")
+_stat_cache = {}
+
+
+def _populate_stat_cache():
+    """Walk the project root and scanned directories once, caching file sizes"""
+    if _stat_cache:
+        return
+
+    with os.scandir(".") as it:
+        for entry in it:
+            if entry.is_file():
+                _stat_cache[entry.name] = entry.stat().st_size
+
+    pending = [d for d in _SCANNED_DIRS if isdir(d)]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                path = os.path.normpath(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(path)
+                elif entry.is_file():
+                    _stat_cache[path] = entry.stat().st_size
+
+
+def _file_exists(file_path):
+    """Check file existence, using the scandir cache for scanned locations"""
+    path = os.path.normpath(file_path)
+    top = path.split(os.sep, 1)[0]
+    if os.sep not in path or top in _SCANNED_DIRS:
+        _populate_stat_cache()
+        return path in _stat_cache
+    return isfile(path)
+
+
+def _list_yaml_files(directory):
+    """List *.yaml entries in a directory using the DirEntry metadata directly"""
+    with os.scandir(directory) as it:
+        return [
+            entry
+            for entry in it
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(".yaml")
+        ]
+
+
+@lru_cache(maxsize=64)
+def _load_yaml(file_path):
+    """Parse a YAML file once per run; callers must not mutate the result"""
+    with open(file_path, "r") as f:
+        return yaml.load(f, Loader=_Loader)
 
 
 def test_file_structure():
@@ -39,11 +110,14 @@ def test_file_structure():
     ]
 
     missing_files = []
+    lines = []
     for file_path in required_files:
-        if not Path(file_path).exists():
+        if not _file_exists(file_path):
             missing_files.append(file_path)
         else:
-            print(f"  ✅ {file_path}")
+            lines.append(f"  ✅ {file_path}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     if missing_files:
         print(f"  ❌ Missing files: {missing_files}")
@@ -53,6 +127,19 @@ def test_file_structure():
     return True
 
 
+def _parse_one(file_path):
+    """Parse a YAML/JSON file, returning (success, path, error or None)"""
+    try:
+        if file_path.endswith(".json"):
+            with open(file_path, "r") as f:
+                json.load(f)
+        else:
+            _load_yaml(file_path)
+        return True, file_path, None
+    except Exception as e:
+        return False, file_path, e
+
+
 def test_yaml_syntax():
     """Test YAML files for syntax errors"""
     print("\n🔍 Testing YAML syntax...")
@@ -65,17 +152,17 @@ def test_yaml_syntax():
         ".github/workflows/fabric-cicd-pipeline.yml",
     ]
 
-    for file_path in yaml_files:
-        if Path(file_path).exists():
-            try:
-                with open(file_path, "r") as f:
-                    if file_path.endswith(".json"):
-                        json.load(f)
-                    else:
-                        yaml.safe_load(f)
+    existing_files = [p for p in yaml_files if _file_exists(p)]
+    if existing_files:
+        with ThreadPoolExecutor(max_workers=len(existing_files)) as executor:
+            results = list(executor.map(_parse_one, existing_files))
+
+        # Report in file order; printing stays on this thread
+        for ok, file_path, error in results:
+            if ok:
                 print(f"  ✅ {file_path} - Valid syntax")
-            except Exception as e:
-                print(f"  ❌ {file_path} - Syntax error: {e}")
+            else:
+                print(f"  ❌ {file_path} - Syntax error: {error}")
                 return False
 
     print("  🎉 All YAML/JSON files have valid syntax!")
@@ -86,9 +173,6 @@ def test_python_imports():
     """Test that Python modules can be imported"""
     print("\n🔍 Testing Python imports...")
 
-    # Add ops directory to Python path
-    sys.path.insert(0, "ops")
-
     test_modules = [
         ("ops.scripts.utilities.config_manager", "ConfigManager"),
         ("ops.scripts.utilities.environment_config", "EnvironmentConfigManager"),
@@ -96,7 +180,13 @@ def test_python_imports():
 
     for module_path, class_name in test_modules:
         try:
-            module = __import__(module_path, fromlist=[class_name])
+            # Fail fast on missing modules without executing any module code
+            if find_spec(module_path) is None:
+                print(f"  ❌ Module not found: {module_path}")
+                return False
+
+            # The class check needs the module executed
+            module = importlib.import_module(module_path)
             getattr(module, class_name)
             print(f"  ✅ {module_path}.{class_name}")
         except ImportError as e:
@@ -115,23 +205,21 @@ def test_data_contracts_validation():
 
     try:
         # Test if the validation script exists and runs
-        if Path("ops/scripts/validate_data_contracts.py").exists():
+        if isfile("ops/scripts/validate_data_contracts.py"):
             print("  ✅ Data contracts validator exists")
 
             # Test discovering contracts
-            contracts_dir = Path("governance/data_contracts")
-            if contracts_dir.exists():
-                contract_files = list(contracts_dir.glob("*.yaml"))
+            contracts_dir = "governance/data_contracts"
+            if isdir(contracts_dir):
+                contract_files = _list_yaml_files(contracts_dir)
                 print(f"  ✅ Found {len(contract_files)} contract file(s)")
 
                 for contract_file in contract_files:
                     try:
-                        with open(contract_file, "r") as f:
-                            contract_data = yaml.safe_load(f)
+                        contract_data = _load_yaml(contract_file.path)
 
                         # Basic validation
-                        required_fields = ["dataset", "owner", "version"]
-                        missing = [f for f in required_fields if f not in contract_data]
+                        missing = sorted(_CONTRACT_REQUIRED.difference(contract_data))
 
                         if missing:
                             print(
@@ -166,19 +254,18 @@ def test_dq_rules_validation():
 
     try:
         # Test if the validation script exists
-        if Path("ops/scripts/validate_dq_rules.py").exists():
+        if isfile("ops/scripts/validate_dq_rules.py"):
             print("  ✅ DQ rules validator exists")
 
             # Test discovering rules
-            rules_dir = Path("governance/dq_rules")
-            if rules_dir.exists():
-                rules_files = list(rules_dir.glob("*.yaml"))
+            rules_dir = "governance/dq_rules"
+            if isdir(rules_dir):
+                rules_files = _list_yaml_files(rules_dir)
                 print(f"  ✅ Found {len(rules_files)} DQ rules file(s)")
 
                 for rules_file in rules_files:
                     try:
-                        with open(rules_file, "r") as f:
-                            rules_data = yaml.safe_load(f)
+                        rules_data = _load_yaml(rules_file.path)
 
                         # Basic validation
                         if "rules" in rules_data and isinstance(
@@ -209,19 +296,23 @@ def test_dq_rules_validation():
     return True
 
 
+def _is_validation_step(step_name):
+    """Check whether a workflow step name looks like a validation step"""
+    lowered = step_name.lower()
+    return "validate" in lowered or "contract" in lowered
+
+
 def test_github_workflow():
     """Test GitHub workflow syntax"""
     print("\n🔍 Testing GitHub workflow...")
 
-    workflow_path = Path(".github/workflows/fabric-cicd-pipeline.yml")
-    if workflow_path.exists():
+    workflow_path = ".github/workflows/fabric-cicd-pipeline.yml"
+    if isfile(workflow_path):
         try:
-            with open(workflow_path, "r") as f:
-                workflow_data = yaml.safe_load(f)
+            workflow_data = _load_yaml(workflow_path)
 
             # Check basic workflow structure
-            required_sections = ["name", "on", "jobs"]
-            missing = [s for s in required_sections if s not in workflow_data]
+            missing = sorted(_WORKFLOW_REQUIRED.difference(workflow_data))
 
             if missing:
                 print(f"  ❌ Workflow missing sections: {missing}")
@@ -231,22 +322,21 @@ def test_github_workflow():
             jobs = workflow_data.get("jobs", {})
             print(f"  ✅ Workflow has {len(jobs)} job(s): {list(jobs.keys())}")
 
-            # Look for validation steps
-            validation_found = False
-            for job_name, job_config in jobs.items():
-                steps = job_config.get("steps", [])
-                for step in steps:
-                    step_name = step.get("name", "")
-                    if (
-                        "validate" in step_name.lower()
-                        or "contract" in step_name.lower()
-                    ):
-                        validation_found = True
-                        print(
-                            f"  ✅ Found validation step: '{step_name}' in job '{job_name}'"
-                        )
-
-            if not validation_found:
+            # Look for a validation step, stopping at the first match
+            validation_step = next(
+                (
+                    (job_name, step_name)
+                    for job_name, job_config in jobs.items()
+                    for step in job_config.get("steps", [])
+                    if _is_validation_step(step_name := step.get("name", ""))
+                ),
+                None,
+            )
+
+            if validation_step:
+                job_name, step_name = validation_step
+                print(f"  ✅ Found validation step: '{step_name}' in job '{job_name}'")
+            else:
                 print("  ⚠️  No validation steps found in workflow")
 
         except Exception as e:
@@ -265,8 +355,8 @@ def test_environment_configuration():
     print("\n🔍 Testing environment configuration...")
 
     # Check .env.example
-    env_example_path = Path(".env.example")
-    if env_example_path.exists():
+    env_example_path = ".env.example"
+    if isfile(env_example_path):
         try:
             with open(env_example_path, "r") as f:
                 env_content = f.read()
@@ -293,11 +383,10 @@ def test_environment_configuration():
         return False
 
     # Check conda environment file
-    conda_env_path = Path("environment.yml")
-    if conda_env_path.exists():
+    conda_env_path = "environment.yml"
+    if isfile(conda_env_path):
         try:
-            with open(conda_env_path, "r") as f:
-                conda_env = yaml.safe_load(f)
+            conda_env = _load_yaml(conda_env_path)
 
             if "dependencies" in conda_env:
                 print("  ✅ Conda environment.yml has dependencies")
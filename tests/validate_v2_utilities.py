@@ -4,11 +4,19 @@ Quick validation test for new v2.0 utilities
 Tests basic functionality without requiring real Fabric API credentials
 """
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Add utilities to path
 UTILITIES_PATH = Path(__file__).parent.parent / "ops" / "scripts" / "utilities"
-sys.path.insert(0, str(UTILITIES_PATH))
+_UTILS_PATH = str(UTILITIES_PATH)
+if _UTILS_PATH not in sys.path:
+    sys.path.insert(0, _UTILS_PATH)
 
 
 def test_item_naming_validator():
@@ -56,57 +64,53 @@ def test_audit_logger():
 
     try:
         import tempfile
-        import json
-
-        # Create temporary audit file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            temp_audit_path = f.name
+        import os
 
         from audit_logger import AuditLogger
 
-        logger = AuditLogger(audit_file_path=temp_audit_path)
-
-        # Test logging workspace creation
-        logger.log_workspace_creation(
-            workspace_id="test-ws-123",
-            workspace_name="Test Workspace",
-            product_id="test_product",
-            environment="dev",
-        )
-        print("  ✅ Workspace creation logging: PASS")
-
-        # Test logging item creation
-        logger.log_item_creation(
-            workspace_id="test-ws-123",
-            item_id="test-item-456",
-            item_name="BRONZE_Test_Lakehouse",
-            item_type="Lakehouse",
-            validation_passed=True,
-        )
-        print("  ✅ Item creation logging: PASS")
-
-        # Test reading events
-        events = logger.read_events()
-        assert len(events) == 2, f"Expected 2 events, got {len(events)}"
-        print(f"  ✅ Event reading: PASS (read {len(events)} events)")
-
-        # Test filtering by event type
-        workspace_events = logger.read_events(event_type="workspace_created")
-        assert (
-            len(workspace_events) == 1
-        ), f"Expected 1 workspace event, got {len(workspace_events)}"
-        print("  ✅ Event filtering: PASS")
-
-        # Verify JSONL format
-        with open(temp_audit_path, "r") as f:
-            for line in f:
-                event = json.loads(line.strip())
-                assert "timestamp" in event
-                assert "event_type" in event
-        print("  ✅ JSONL format validation: PASS")
-
-        # Cleanup
-        Path(temp_audit_path).unlink()
+        # Audit file lives in a temporary directory that is removed on exit
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_audit_path = os.path.join(temp_dir, "audit.jsonl")
+            logger = AuditLogger(audit_file=temp_audit_path)
+
+            # Test logging workspace creation
+            logger.log_workspace_creation(
+                workspace_id="test-ws-123",
+                workspace_name="Test Workspace",
+                product_id="test_product",
+                environment="dev",
+            )
+            print("  ✅ Workspace creation logging: PASS")
+
+            # Test logging item creation
+            logger.log_item_creation(
+                workspace_id="test-ws-123",
+                item_id="test-item-456",
+                item_name="BRONZE_Test_Lakehouse",
+                item_type="Lakehouse",
+                validation_passed=True,
+            )
+            print("  ✅ Item creation logging: PASS")
+
+            # Test reading events
+            events = logger.read_events()
+            assert len(events) == 2, f"Expected 2 events, got {len(events)}"
+            print(f"  ✅ Event reading: PASS (read {len(events)} events)")
+
+            # Test filtering by event type
+            workspace_events = logger.read_events(event_type="workspace_created")
+            assert (
+                len(workspace_events) == 1
+            ), f"Expected 1 workspace event, got {len(workspace_events)}"
+            print("  ✅ Event filtering: PASS")
+
+            # Verify JSONL format
+            for line in Path(temp_audit_path).read_bytes().splitlines():
+                if line:
+                    event = _json_loads(line)
+                    assert "timestamp" in event
+                    assert "event_type" in event
+            print("  ✅ JSONL format validation: PASS")
 
         print("  ✅ AuditLogger: ALL TESTS PASSED")
         return True
@@ -171,35 +175,25 @@ def test_imports():
 
     imports_ok = True
 
-    try:
-        print("  ✅ item_naming_validator: OK")
-    except Exception as e:
-        print(f"  ❌ item_naming_validator: FAILED - {e}")
-        imports_ok = False
-
-    try:
-        print("  ✅ audit_logger: OK")
-    except Exception as e:
-        print(f"  ❌ audit_logger: FAILED - {e}")
-        imports_ok = False
-
-    try:
-        print("  ✅ fabric_git_connector: OK")
-    except Exception as e:
-        print(f"  ❌ fabric_git_connector: FAILED - {e}")
-        imports_ok = False
-
-    try:
-        print("  ✅ fabric_item_manager: OK (enhanced)")
-    except Exception as e:
-        print(f"  ❌ fabric_item_manager: FAILED - {e}")
-        imports_ok = False
-
-    try:
-        print("  ✅ workspace_manager: OK (enhanced)")
-    except Exception as e:
-        print(f"  ❌ workspace_manager: FAILED - {e}")
-        imports_ok = False
+    # find_spec locates each module without executing its top-level code
+    modules = [
+        ("item_naming_validator", ""),
+        ("audit_logger", ""),
+        ("fabric_git_connector", ""),
+        ("fabric_item_manager", " (enhanced)"),
+        ("workspace_manager", " (enhanced)"),
+    ]
+
+    for module_name, note in modules:
+        try:
+            if find_spec(module_name) is None:
+                print(f"  ❌ {module_name}: FAILED - module not found")
+                imports_ok = False
+            else:
+                print(f"  ✅ {module_name}: OK{note}")
+        except Exception as e:
+            print(f"  ❌ {module_name}: FAILED - {e}")
+            imports_ok = False
 
     return imports_ok
 
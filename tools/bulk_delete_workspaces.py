@@ -6,8 +6,19 @@ Supports multiple deletion methods:
 1. Direct workspace IDs as arguments
 2. Reading from a file (--file/-f)
 3. Deleting all workspaces (--all)
+
+Confirmation prompts are skipped with --yes/-y or FABRIC_BULK_CONFIRM=1,
+--dry-run only lists what would be deleted, and --concurrency bounds the
+number of deletions in flight. With --all, --filter-prefix and
+--filter-capacity narrow the listed workspaces.
 """
+import argparse
+import asyncio
+import os
+import re
 import sys
+import time
+from collections import Counter
 from dotenv import load_dotenv
 
 sys.path.insert(0, "ops/scripts")
@@ -16,18 +27,63 @@ from utilities.workspace_manager import WorkspaceManager
 
 load_dotenv()
 
+# Workspace IDs are GUIDs; anything else would only fail after an API round trip
+_UUID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
 
-def read_workspace_ids_from_file(file_path):
-    """Read workspace IDs from a file (one per line, supports comments)"""
-    workspace_ids = []
+# Maximum number of workspace deletions in flight at once
+DEFAULT_CONCURRENCY = 10
+
+# Maximum number of delete requests issued per second
+DEFAULT_RATE_PER_SECOND = 10
+
+# Per-workspace outcomes reported by _delete_one
+DELETED = "deleted"
+NOT_FOUND = "not_found"
+FAILED = "failed"
+
+
+class AsyncTokenBucket:
+    """Token bucket that paces request issuance across asyncio tasks"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def write_lines(lines):
+    """Write a batch of status lines to stdout in a single call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def iter_workspace_ids(file_path):
+    """Yield workspace IDs from a file (one per line, supports comments)"""
     try:
-        with open(file_path, "r") as f:
+        with open(file_path, "r", buffering=1 << 20) as f:
             for line in f:
                 line = line.strip()
                 # Skip empty lines and comments
                 if line and not line.startswith("#"):
-                    workspace_ids.append(line)
-        return workspace_ids
+                    yield line
     except FileNotFoundError:
         print(f"❌ Error: File not found: {file_path}")
         sys.exit(1)
@@ -36,36 +92,183 @@ def read_workspace_ids_from_file(file_path):
         sys.exit(1)
 
 
-def print_usage():
-    """Print usage information"""
-    print("Usage:")
-    print(
-        "  1. Direct IDs:  python3 bulk_delete_workspaces.py <workspace_id_1> <workspace_id_2> ..."
+def read_workspace_ids_from_file(file_path):
+    """Read unique workspace IDs from a file, preserving first-seen order"""
+    return list(dict.fromkeys(iter_workspace_ids(file_path)))
+
+
+def drop_invalid_workspace_ids(workspace_ids):
+    """Return only well-formed workspace IDs, reporting any that are skipped"""
+    valid, invalid = [], []
+    for ws_id in workspace_ids:
+        (valid if _UUID_RE.match(ws_id) else invalid).append(ws_id)
+
+    if invalid:
+        write_lines(
+            [f"⚠️  Skipping {len(invalid)} invalid workspace ID(s):"]
+            + [f"   - {ws_id}" for ws_id in invalid]
+        )
+
+    return valid
+
+
+async def _delete_one(manager, semaphore, limiter, workspace_id):
+    """Delete a single workspace, returning (outcome, status line)
+
+    The outcome is DELETED, NOT_FOUND (delete_workspace returned False)
+    or FAILED. Bounded by the shared semaphore and limiter.
+    """
+    async with semaphore:
+        await limiter.acquire()
+        try:
+            deleted = await asyncio.to_thread(
+                manager.delete_workspace, workspace_id, force=True
+            )
+        except Exception as e:
+            return FAILED, f"❌ Failed to delete {workspace_id}: {str(e)}"
+
+        if not deleted:
+            return NOT_FOUND, f"⚠️  Workspace not found: {workspace_id}"
+        return DELETED, f"✅ Deleted workspace: {workspace_id}"
+
+
+async def delete_workspaces(
+    manager,
+    workspace_ids,
+    concurrency=DEFAULT_CONCURRENCY,
+    rate_per_second=DEFAULT_RATE_PER_SECOND,
+):
+    """Delete workspaces concurrently, returning one (outcome, status line) per ID
+
+    Issuance is paced by a token bucket; 429 Retry-After responses are
+    honoured by WorkspaceManager, which pauses every in-flight request.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = AsyncTokenBucket(rate_per_second)
+    return await asyncio.gather(
+        *(_delete_one(manager, semaphore, limiter, wid) for wid in workspace_ids)
     )
-    print(
-        "  2. From file:   python3 bulk_delete_workspaces.py --file <path/to/file.txt>"
+
+
+def print_summary(results):
+    """Print per-workspace status lines followed by the totals"""
+    write_lines([line for _, line in results])
+    counts = Counter(outcome for outcome, _ in results)
+
+    print("\n📊 Summary:")
+    print(f"   ✅ Deleted: {counts[DELETED]}")
+    print(f"   ⚠️  Not found: {counts[NOT_FOUND]}")
+    print(f"   ❌ Failed: {counts[FAILED]}")
+    print(f"   📋 Total: {len(results)}")
+
+
+_EPILOG = """\
+examples:
+  python3 bulk_delete_workspaces.py <workspace_id_1> <workspace_id_2> ...
+  python3 bulk_delete_workspaces.py --file <path/to/file.txt> --yes
+  python3 bulk_delete_workspaces.py --all --filter-prefix <name-prefix>
+  python3 bulk_delete_workspaces.py --all --filter-capacity <capacity-id> --dry-run
+
+Set FABRIC_BULK_CONFIRM=1 to skip confirmation prompts (same as --yes).
+
+File format (one workspace ID per line):
+  8070ecd4-d1f2-4b08-addc-4a78adf2e1a4
+  4f2a427d-9040-4bc6-b410-cbeb8e7c7bf4
+  # Comments are supported
+  e5ca7fe9-e1f2-470b-97aa-5723ffef40de
+"""
+
+
+def _positive_int(value):
+    """argparse type for options that must be >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def build_parser():
+    """Build the command-line parser"""
+    parser = argparse.ArgumentParser(
+        description="Bulk delete Microsoft Fabric workspaces",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
+    )
+
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("ids", nargs="*", default=[], help="Workspace IDs to delete")
+    source.add_argument("-f", "--file", help="File with one workspace ID per line")
+    source.add_argument("--all", action="store_true", help="Delete all workspaces")
+
+    parser.add_argument(
+        "--filter-prefix", help="With --all: only workspaces whose name starts with this"
     )
-    print("                  python3 bulk_delete_workspaces.py -f <path/to/file.txt>")
-    print("  3. Delete all:  python3 bulk_delete_workspaces.py --all")
+    parser.add_argument(
+        "--filter-capacity", help="With --all: only workspaces on this capacity ID"
+    )
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="Skip confirmation prompts"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show what would be deleted and exit"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum deletions in flight (default: {DEFAULT_CONCURRENCY})",
+    )
+    return parser
+
+
+def confirm_deletion(banner, expected):
+    """Prompt for the typed confirmation phrase; True if it matches"""
+    print()
+    print("=" * 70)
+    print(banner)
+    print("=" * 70)
+    confirm = input(f"\n👉 Type '{expected}' to confirm: ")
+    print("=" * 70)
     print()
-    print("File format (one workspace ID per line):")
-    print("  8070ecd4-d1f2-4b08-addc-4a78adf2e1a4")
-    print("  4f2a427d-9040-4bc6-b410-cbeb8e7c7bf4")
-    print("  # Comments are supported")
-    print("  e5ca7fe9-e1f2-470b-97aa-5723ffef40de")
 
+    if confirm != expected:
+        print("❌ Deletion cancelled")
+        return False
+    return True
+
+
+def main(argv=None):
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Bare invocation and the legacy `help` form both show usage
+    if not argv or argv == ["help"]:
+        parser.print_help()
+        sys.exit(0 if argv else 1)
 
-def main():
-    if len(sys.argv) < 2 or sys.argv[1] in ["--help", "-h", "help"]:
-        print_usage()
-        sys.exit(0 if len(sys.argv) > 1 else 1)
+    args = parser.parse_args(argv)
+    if not (args.all or args.file or args.ids):
+        parser.error("specify workspace IDs, --file or --all")
+
+    list_filters = {
+        key: value
+        for key, value in (
+            ("name_prefix", args.filter_prefix),
+            ("capacity_id", args.filter_capacity),
+        )
+        if value
+    }
+    if list_filters and not args.all:
+        parser.error("--filter-prefix/--filter-capacity can only be used with --all")
+
+    assume_yes = args.yes or os.getenv("FABRIC_BULK_CONFIRM") == "1"
 
     manager = WorkspaceManager()
-    workspace_ids = []
 
-    if sys.argv[1] == "--all":
-        # Get all workspaces
-        workspaces = manager.list_workspaces()
+    if args.all:
+        # List every page before deleting anything: deleting while paging
+        # would shift the collection under continuationToken and skip workspaces
+        workspaces = manager.list_workspaces(**list_filters)
         workspace_ids = [ws["id"] for ws in workspaces]
 
         if not workspace_ids:
@@ -75,30 +278,25 @@ def main():
         print(
             f"⚠️  WARNING: You are about to delete ALL {len(workspace_ids)} workspaces:"
         )
-        for ws in workspaces:
-            print(f"   - {ws.get('displayName', 'Unknown')} ({ws['id']})")
-
-        print()
-        print("=" * 70)
-        print("⚠️  DANGER ZONE - This will DELETE all workspaces listed above!")
-        print("=" * 70)
-        confirm = input("\n👉 Type 'DELETE ALL' to confirm: ")
-        print("=" * 70)
-        print()
-
-        if confirm != "DELETE ALL":
-            print("❌ Deletion cancelled")
+        write_lines(
+            [f"   - {ws.get('displayName', 'Unknown')} ({ws['id']})" for ws in workspaces]
+        )
+
+        if args.dry_run:
+            print("\n🔍 Dry run - no workspaces were deleted")
             return
 
-    elif sys.argv[1] in ["--file", "-f"]:
-        # Read workspace IDs from file
-        if len(sys.argv) < 3:
-            print("❌ Error: Please specify a file path")
-            print("Usage: python3 bulk_delete_workspaces.py --file <path/to/file.txt>")
-            sys.exit(1)
+        if not assume_yes and not confirm_deletion(
+            "⚠️  DANGER ZONE - This will DELETE all workspaces listed above!",
+            "DELETE ALL",
+        ):
+            return
 
-        file_path = sys.argv[2]
-        workspace_ids = read_workspace_ids_from_file(file_path)
+    elif args.file:
+        # Read workspace IDs from file
+        workspace_ids = drop_invalid_workspace_ids(
+            read_workspace_ids_from_file(args.file)
+        )
 
         if not workspace_ids:
             print("⚠️ No workspace IDs found in file")
@@ -107,46 +305,41 @@ def main():
         print(
             f"\n⚠️  WARNING: You are about to delete {len(workspace_ids)} workspace(s) from file:"
         )
-        print(f"   File: {file_path}")
-        for ws_id in workspace_ids:
-            print(f"   - {ws_id}")
-
-        print()
-        print("=" * 70)
-        print(
-            f"⚠️  DANGER ZONE - This will DELETE {len(workspace_ids)} workspace(s) listed above!"
+        write_lines(
+            [f"   File: {args.file}"] + [f"   - {ws_id}" for ws_id in workspace_ids]
         )
-        print("=" * 70)
-        confirm = input(f"\n👉 Type 'DELETE {len(workspace_ids)}' to confirm: ")
-        print("=" * 70)
-        print()
 
-        if confirm != f"DELETE {len(workspace_ids)}":
-            print("❌ Deletion cancelled")
+        if args.dry_run:
+            print("\n🔍 Dry run - no workspaces were deleted")
+            return
+
+        if not assume_yes and not confirm_deletion(
+            f"⚠️  DANGER ZONE - This will DELETE {len(workspace_ids)} workspace(s) listed above!",
+            f"DELETE {len(workspace_ids)}",
+        ):
             return
 
     else:
         # Use provided workspace IDs from command line arguments
-        workspace_ids = sys.argv[1:]
+        workspace_ids = drop_invalid_workspace_ids(args.ids)
 
-    print(f"\n🗑️  Deleting {len(workspace_ids)} workspace(s)...")
+        if not workspace_ids:
+            print("⚠️ No valid workspace IDs provided")
+            return
 
-    success_count = 0
-    fail_count = 0
+        if args.dry_run:
+            write_lines(
+                [f"\n🔍 Dry run - would delete {len(workspace_ids)} workspace(s):"]
+                + [f"   - {ws_id}" for ws_id in workspace_ids]
+            )
+            return
 
-    for workspace_id in workspace_ids:
-        try:
-            manager.delete_workspace(workspace_id, force=True)
-            print(f"✅ Deleted workspace: {workspace_id}")
-            success_count += 1
-        except Exception as e:
-            print(f"❌ Failed to delete {workspace_id}: {str(e)}")
-            fail_count += 1
+    print(f"\n🗑️  Deleting {len(workspace_ids)} workspace(s)...")
 
-    print("\n📊 Summary:")
-    print(f"   ✅ Deleted: {success_count}")
-    print(f"   ❌ Failed: {fail_count}")
-    print(f"   📋 Total: {len(workspace_ids)}")
+    results = asyncio.run(
+        delete_workspaces(manager, workspace_ids, args.concurrency)
+    )
+    print_summary(results)
 
 
 if __name__ == "__main__":
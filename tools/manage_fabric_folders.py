@@ -56,12 +56,20 @@ Examples:
 import os
 import sys
 import argparse
+import functools
+from collections import defaultdict
 import json
 import yaml
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 # Load environment variables from .env file
 env_file = Path(__file__).parent.parent / '.env'
 if env_file.exists():
@@ -72,8 +80,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ops.scripts.utilities.fabric_folder_manager import (
     FabricFolderManager,
+    FolderInfo,
     FolderValidationError,
-    FolderOperationError
+    FolderOperationError,
+    FolderStructureError,
 )
 from ops.scripts.utilities.fabric_api import FabricClient
 from ops.scripts.utilities.framework_validator import validate_framework_prerequisites
@@ -85,23 +95,27 @@ from ops.scripts.utilities.output import (
 )
 
 
+# libyaml-backed loader when available, pure-Python fallback otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 # ============================================================================
 # FOLDER STRUCTURE TEMPLATES
 # ============================================================================
 
-TEMPLATES = {
+_TEMPLATES = {
     "medallion": {
         "name": "Medallion Architecture",
         "description": "Bronze/Silver/Gold lakehouse layers",
         "structure": {
             "Bronze Layer": {
-                "subfolders": ["Raw Data", "Archive"]
+                "subfolders": ("Raw Data", "Archive")
             },
             "Silver Layer": {
-                "subfolders": ["Cleaned", "Transformed"]
+                "subfolders": ("Cleaned", "Transformed")
             },
             "Gold Layer": {
-                "subfolders": ["Analytics", "Reports"]
+                "subfolders": ("Analytics", "Reports")
             }
         }
     },
@@ -110,13 +124,13 @@ TEMPLATES = {
         "description": "ML/AI project structure",
         "structure": {
             "Data": {
-                "subfolders": ["Raw", "Processed", "External"]
+                "subfolders": ("Raw", "Processed", "External")
             },
             "Notebooks": {
-                "subfolders": ["Exploration", "Feature Engineering", "Modeling"]
+                "subfolders": ("Exploration", "Feature Engineering", "Modeling")
             },
             "Models": {
-                "subfolders": ["Training", "Production", "Archive"]
+                "subfolders": ("Training", "Production", "Archive")
             },
             "Reports": {}
         }
@@ -126,16 +140,16 @@ TEMPLATES = {
         "description": "Organize by business department",
         "structure": {
             "Sales": {
-                "subfolders": ["Reports", "Dashboards", "Data"]
+                "subfolders": ("Reports", "Dashboards", "Data")
             },
             "Marketing": {
-                "subfolders": ["Reports", "Dashboards", "Data"]
+                "subfolders": ("Reports", "Dashboards", "Data")
             },
             "Finance": {
-                "subfolders": ["Reports", "Dashboards", "Data"]
+                "subfolders": ("Reports", "Dashboards", "Data")
             },
             "Operations": {
-                "subfolders": ["Reports", "Dashboards", "Data"]
+                "subfolders": ("Reports", "Dashboards", "Data")
             }
         }
     },
@@ -151,6 +165,9 @@ TEMPLATES = {
     }
 }
 
+# Read-only view: templates are static and shared across commands
+TEMPLATES = MappingProxyType(_TEMPLATES)
+
 
 # ============================================================================
 # CLI COMMANDS
@@ -158,8 +175,8 @@ TEMPLATES = {
 
 def cmd_create(args):
     """Create a folder"""
-    manager = FabricFolderManager()
-    client = FabricClient()
+    manager = _get_manager()
+    client = _get_client()
     
     # Get workspace ID
     workspace_id = args.workspace_id or os.getenv("FABRIC_WORKSPACE_ID")
@@ -172,8 +189,8 @@ def cmd_create(args):
     parent_id = None
     if args.parent:
         print_info(f"  Looking for parent folder '{args.parent}'...")
-        folders = manager.list_folders(workspace_id)
-        parent = next((f for f in folders if f.display_name == args.parent), None)
+        folders = _index_folders(_cached_list_folders(manager, workspace_id))
+        parent = folders.get(args.parent)
         if not parent:
             print_error(f"Parent folder '{args.parent}' not found")
             return 1
@@ -187,6 +204,7 @@ def cmd_create(args):
             parent_folder_id=parent_id,
             description=args.description
         )
+        _cached_list_folders.cache_clear()
         
         print_success(f"\n✅ Created folder: {args.name}")
         print_info(f"   ID: {folder_id}")
@@ -204,8 +222,8 @@ def cmd_create(args):
 
 def cmd_list(args):
     """List folders in workspace"""
-    manager = FabricFolderManager()
-    client = FabricClient()
+    manager = _get_manager()
+    client = _get_client()
     
     # Get workspace ID
     workspace_id = args.workspace_id or os.getenv("FABRIC_WORKSPACE_ID")
@@ -223,9 +241,12 @@ def cmd_list(args):
         
         print_success(f"\nFound {len(folders)} folder(s):\n")
         
-        # Group by parent
-        root_folders = [f for f in folders if f.parent_folder_id is None]
-        subfolders = [f for f in folders if f.parent_folder_id is not None]
+        # Group by parent in a single pass (None = root level)
+        children_by_parent: Dict[Optional[str], List[FolderInfo]] = defaultdict(list)
+        for folder in folders:
+            children_by_parent[folder.parent_folder_id].append(folder)
+        root_folders = children_by_parent[None]
+        subfolder_count = len(folders) - len(root_folders)
         
         # Show root folders
         for folder in root_folders:
@@ -234,14 +255,13 @@ def cmd_list(args):
             
             # Show immediate children if requested
             if args.show_children:
-                children = [f for f in subfolders if f.parent_folder_id == folder.id]
-                for child in children:
+                for child in children_by_parent.get(folder.id, ()):
                     print_info(f"   └─ 📁 {child.display_name} ({child.id[:8]}...)")
             print()
         
         # Show orphaned subfolders (shouldn't happen but good to check)
-        if subfolders and not args.show_children:
-            print_info(f"\n{len(subfolders)} subfolder(s) not shown (use --show-children)")
+        if subfolder_count and not args.show_children:
+            print_info(f"\n{subfolder_count} subfolder(s) not shown (use --show-children)")
         
         return 0
         
@@ -252,8 +272,8 @@ def cmd_list(args):
 
 def cmd_tree(args):
     """Show folder tree"""
-    manager = FabricFolderManager()
-    client = FabricClient()
+    manager = _get_manager()
+    client = _get_client()
     
     # Get workspace ID
     workspace_id = args.workspace_id or os.getenv("FABRIC_WORKSPACE_ID")
@@ -273,8 +293,8 @@ def cmd_tree(args):
 
 def cmd_move(args):
     """Move folder to different parent"""
-    manager = FabricFolderManager()
-    client = FabricClient()
+    manager = _get_manager()
+    client = _get_client()
     
     # Get workspace ID
     workspace_id = args.workspace_id or os.getenv("FABRIC_WORKSPACE_ID")
@@ -285,8 +305,8 @@ def cmd_move(args):
     
     try:
         # Find folder to move
-        folders = manager.list_folders(workspace_id)
-        folder = next((f for f in folders if f.display_name == args.folder), None)
+        folders = _index_folders(_cached_list_folders(manager, workspace_id))
+        folder = folders.get(args.folder)
         if not folder:
             print_error(f"Folder '{args.folder}' not found")
             return 1
@@ -294,7 +314,7 @@ def cmd_move(args):
         # Find new parent
         new_parent_id = None
         if args.parent:
-            parent = next((f for f in folders if f.display_name == args.parent), None)
+            parent = folders.get(args.parent)
             if not parent:
                 print_error(f"Parent folder '{args.parent}' not found")
                 return 1
@@ -304,6 +324,7 @@ def cmd_move(args):
             print_info(f"  Moving to workspace root")
         
         manager.move_folder(workspace_id, folder.id, new_parent_id)
+        _cached_list_folders.cache_clear()
         
         print_success(f"\n✅ Moved folder: {args.folder}")
         
@@ -320,8 +341,8 @@ def cmd_move(args):
 
 def cmd_delete(args):
     """Delete folder"""
-    manager = FabricFolderManager()
-    client = FabricClient()
+    manager = _get_manager()
+    client = _get_client()
     
     # Get workspace ID
     workspace_id = args.workspace_id or os.getenv("FABRIC_WORKSPACE_ID")
@@ -332,8 +353,8 @@ def cmd_delete(args):
     
     try:
         # Find folder
-        folders = manager.list_folders(workspace_id)
-        folder = next((f for f in folders if f.display_name == args.folder), None)
+        folders = _index_folders(_cached_list_folders(manager, workspace_id))
+        folder = folders.get(args.folder)
         if not folder:
             print_error(f"Folder '{args.folder}' not found")
             return 1
@@ -350,6 +371,7 @@ def cmd_delete(args):
                 return 0
         
         manager.delete_folder(workspace_id, folder.id, force=args.force)
+        _cached_list_folders.cache_clear()
         
         print_success(f"\n✅ Deleted folder: {args.folder}")
         
@@ -366,8 +388,8 @@ def cmd_delete(args):
 
 def cmd_create_structure(args):
     """Create folder structure from template or config"""
-    manager = FabricFolderManager()
-    client = FabricClient()
+    manager = _get_manager()
+    client = _get_client()
     
     # Get workspace ID
     workspace_id = args.workspace_id or os.getenv("FABRIC_WORKSPACE_ID")
@@ -380,7 +402,7 @@ def cmd_create_structure(args):
         try:
             with open(args.config, 'r') as f:
                 if args.config.endswith('.yaml') or args.config.endswith('.yml'):
-                    structure = yaml.safe_load(f)
+                    structure = yaml.load(f, Loader=_YAML_LOADER)
                 else:
                     structure = json.load(f)
         except Exception as e:
@@ -403,7 +425,7 @@ def cmd_create_structure(args):
     # Show structure
     if args.dry_run:
         print_info("\n🔍 Dry run - would create:")
-        _print_structure(structure)
+        print_info(_format_structure(structure))
         return 0
     
     # Create structure
@@ -411,6 +433,7 @@ def cmd_create_structure(args):
     
     try:
         folder_ids = manager.create_folder_structure(workspace_id, structure)
+        _cached_list_folders.cache_clear()
         
         print_success(f"\n✅ Created {len(folder_ids)} folder(s)")
         
@@ -420,12 +443,21 @@ def cmd_create_structure(args):
         
         # Save folder IDs if requested
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(folder_ids, f, indent=2)
+            _write_json(folder_ids, args.output)
             print_info(f"\n💾 Saved folder IDs to {args.output}")
         
         return 0
         
+    except FolderStructureError as e:
+        _cached_list_folders.cache_clear()
+        print_error(f"\n❌ Failed to create structure: {e}")
+        
+        # Keep a record of the partial structure so it can be cleaned up or completed
+        if e.folder_ids and args.output:
+            _write_json(e.folder_ids, args.output)
+            print_info(f"\n💾 Saved IDs of the {len(e.folder_ids)} created folder(s) to {args.output}")
+        return 1
+    
     except (FolderValidationError, FolderOperationError) as e:
         print_error(f"\n❌ Failed to create structure: {e}")
         return 1
@@ -433,8 +465,8 @@ def cmd_create_structure(args):
 
 def cmd_move_items(args):
     """Move items to folder"""
-    manager = FabricFolderManager()
-    client = FabricClient()
+    manager = _get_manager()
+    client = _get_client()
     
     # Get workspace ID
     workspace_id = args.workspace_id or os.getenv("FABRIC_WORKSPACE_ID")
@@ -445,8 +477,8 @@ def cmd_move_items(args):
     
     try:
         # Find folder
-        folders = manager.list_folders(workspace_id)
-        folder = next((f for f in folders if f.display_name == args.folder), None)
+        folders = _index_folders(_cached_list_folders(manager, workspace_id))
+        folder = folders.get(args.folder)
         if not folder:
             print_error(f"Folder '{args.folder}' not found")
             return 1
@@ -495,14 +527,61 @@ def cmd_list_templates(args):
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def _print_structure(structure: Dict[str, Any], indent: int = 0):
-    """Print folder structure with indentation"""
+@functools.cache
+def _get_manager() -> FabricFolderManager:
+    """Shared folder manager, so the token and HTTP session are reused"""
+    return FabricFolderManager()
+
+
+@functools.cache
+def _get_client() -> FabricClient:
+    """Shared Fabric client, so workspace lookups and the token are reused"""
+    return FabricClient()
+
+
+def _reset_singletons():
+    """Drop the shared manager/client and cached folder listings (for tests)"""
+    _get_manager.cache_clear()
+    _get_client.cache_clear()
+    _cached_list_folders.cache_clear()
+
+
+def _index_folders(folders: List[FolderInfo]) -> Dict[str, FolderInfo]:
+    """Index folders by display name (first occurrence wins, like next())"""
+    index: Dict[str, FolderInfo] = {}
+    for folder in folders:
+        index.setdefault(folder.display_name, folder)
+    return index
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_list_folders(manager: FabricFolderManager, workspace_id: str) -> List[FolderInfo]:
+    """List folders once per manager/workspace; cleared after any folder change"""
+    return manager.list_folders(workspace_id)
+
+
+def _write_json(obj: Any, path: str):
+    """Write obj as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        # Match orjson: raw UTF-8 rather than \uXXXX escapes for non-ASCII names
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def _format_structure(structure: Dict[str, Any], indent: int = 0) -> str:
+    """Render folder structure with indentation as a single string"""
+    lines = []
     for name, config in structure.items():
-        print_info("  " * indent + f"📁 {name}")
+        lines.append("  " * indent + f"📁 {name}")
         
         if isinstance(config, dict) and "subfolders" in config:
-            for subfolder in config["subfolders"]:
-                print_info("  " * (indent + 1) + f"📁 {subfolder}")
+            sub_indent = "  " * (indent + 1)
+            lines.extend(f"{sub_indent}📁 {subfolder}" for subfolder in config["subfolders"])
+    
+    return "\n".join(lines)
 
 
 # ============================================================================
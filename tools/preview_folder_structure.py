@@ -4,160 +4,397 @@ Preview Folder Structure - No Credentials Required
 Shows what folder structure would be created without connecting to Fabric
 """
 
-# Color codes for terminal output
-GREEN = '\033[92m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-END = '\033[0m'
+import codecs
+import os
+import re
+import shutil
+import sys
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+# Color codes for terminal output; disabled for pipes/redirects and NO_COLOR
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+GREEN = '\033[92m' if _USE_COLOR else ''
+YELLOW = '\033[93m' if _USE_COLOR else ''
+BLUE = '\033[94m' if _USE_COLOR else ''
+END = '\033[0m' if _USE_COLOR else ''
+
+_COLORS = tuple(color for color in (GREEN, YELLOW, BLUE) if color)
+
+# Color-wrapped templates, built once at import
+_SUCCESS_FMT = GREEN + "%s" + END
+_INFO_FMT = BLUE + "%s" + END
+_WARNING_FMT = YELLOW + "%s" + END
+
+# Section separators, sized once to the terminal (capped at 80 columns)
+_WIDTH = min(80, shutil.get_terminal_size((80, 24)).columns)
+_EQ = "=" * _WIDTH
+_DASH = "-" * _WIDTH
+
+def print_success(msg): print(_SUCCESS_FMT % msg)
+def print_info(msg): print(_INFO_FMT % msg)
+def print_warning(msg): print(_WARNING_FMT % msg)
+
+
+class Subfolder(NamedTuple):
+    name: str
+    description: str
+
+
+class Folder(NamedTuple):
+    name: str
+    description: str
+    subfolders: Tuple[Subfolder, ...] = ()
+
+
+class Template(NamedTuple):
+    name: str
+    description: str
+    folders: Tuple[Folder, ...]
 
-def print_success(msg): print(f"{GREEN}{msg}{END}")
-def print_info(msg): print(f"{BLUE}{msg}{END}")
-def print_warning(msg): print(f"{YELLOW}{msg}{END}")
 
 # Medallion Architecture Template
-MEDALLION_STRUCTURE = {
-    "name": "Medallion Architecture",
-    "description": "Bronze/Silver/Gold data lake structure",
-    "folders": [
-        {
-            "name": "Bronze Layer",
-            "description": "Raw data ingestion layer",
-            "subfolders": [
-                {"name": "Raw Data", "description": "Ingested raw data"},
-                {"name": "Archive", "description": "Historical data archive"},
-                {"name": "External Sources", "description": "Third-party data sources"}
-            ]
-        },
-        {
-            "name": "Silver Layer",
-            "description": "Cleansed and validated data",
-            "subfolders": [
-                {"name": "Cleaned", "description": "Cleansed datasets"},
-                {"name": "Transformed", "description": "Transformed data"},
-                {"name": "Validated", "description": "Quality validated data"}
-            ]
-        },
-        {
-            "name": "Gold Layer",
-            "description": "Analytics-ready data",
-            "subfolders": [
-                {"name": "Analytics", "description": "Analytics datasets"},
-                {"name": "Reports", "description": "Report-ready data"},
-                {"name": "Business Metrics", "description": "Business KPIs and metrics"}
-            ]
-        }
-    ]
-}
+MEDALLION_STRUCTURE = Template(
+    name="Medallion Architecture",
+    description="Bronze/Silver/Gold data lake structure",
+    folders=(
+        Folder(
+            "Bronze Layer",
+            "Raw data ingestion layer",
+            (
+                Subfolder("Raw Data", "Ingested raw data"),
+                Subfolder("Archive", "Historical data archive"),
+                Subfolder("External Sources", "Third-party data sources"),
+            ),
+        ),
+        Folder(
+            "Silver Layer",
+            "Cleansed and validated data",
+            (
+                Subfolder("Cleaned", "Cleansed datasets"),
+                Subfolder("Transformed", "Transformed data"),
+                Subfolder("Validated", "Quality validated data"),
+            ),
+        ),
+        Folder(
+            "Gold Layer",
+            "Analytics-ready data",
+            (
+                Subfolder("Analytics", "Analytics datasets"),
+                Subfolder("Reports", "Report-ready data"),
+                Subfolder("Business Metrics", "Business KPIs and metrics"),
+            ),
+        ),
+    ),
+)
 
 TEMPLATES = {
     "medallion": MEDALLION_STRUCTURE,
 }
 
+# Valid --template values, frozen once for argparse and subcommand sniffing
+_TEMPLATE_CHOICES = tuple(TEMPLATES)
 
-def preview_structure(template_name="medallion"):
-    """Preview folder structure without credentials"""
+# Intelligent placement: item name prefix -> target folder
+_PREFIX_FOLDERS = {
+    "BRONZE_": "Bronze Layer/Raw Data",
+    "SILVER_": "Silver Layer/Cleaned",
+    "GOLD_": "Gold Layer/Analytics",
+}
+
+# Numbered notebooks: (first, last, target folder); last=None is open-ended
+_NUM_BUCKETS = (
+    (1, 9, "Bronze Layer/Raw Data"),
+    (10, 19, "Silver Layer/Transformed"),
+    (20, 29, "Gold Layer/Analytics"),
+    (50, None, "Workspace Root"),
+)
+
+
+def _build_rules():
+    """Display rows (pattern, target folder, description) for the placement tables"""
+    rules = [
+        (f"{prefix}*", folder, f"Items prefixed with {prefix}")
+        for prefix, folder in _PREFIX_FOLDERS.items()
+    ]
+    for first, last, folder in _NUM_BUCKETS:
+        numbers = f"{first:02d}+" if last is None else f"{first:02d}-{last:02d}"
+        rules.append((f"{numbers}_*", folder, f"Notebooks numbered {numbers}"))
+    return tuple(rules)
+
+
+# Rendered by --show-placement; derived from the same tables classify() uses
+_RULES = _build_rules()
+
+# Placement rows pre-padded and color-wrapped once: (rule line, description line)
+_RULES_RENDERED = tuple(
+    (
+        _SUCCESS_FMT % f"  {pattern.ljust(15)} → {folder}",
+        _INFO_FMT % f"                    ({description})",
+    )
+    for pattern, folder, description in _RULES
+)
+
+# Layer prefixes, matched in one pass by a single compiled alternation
+_PREFIX_RE = re.compile("|".join(map(re.escape, _PREFIX_FOLDERS)))
+
+
+def _num_prefix(name):
+    """Return N for names starting "NN_" (two ASCII digits), else None"""
+    # Range comparisons accept only ASCII digits, unlike str.isdigit()
+    if len(name) > 2 and "0" <= name[0] <= "9" and "0" <= name[1] <= "9" and name[2] == "_":
+        return int(name[:2])
+    return None
+
+
+@lru_cache(maxsize=4096)
+def classify(name):
+    """Return the target folder for an item name, or None if no rule matches"""
+    number = _num_prefix(name)
+    if number is not None:
+        for first, last, folder in _NUM_BUCKETS:
+            if first <= number and (last is None or number <= last):
+                return folder
+        return None
     
-    if template_name not in TEMPLATES:
-        print_warning(f"Unknown template: {template_name}")
-        print_info(f"Available templates: {', '.join(TEMPLATES.keys())}")
+    match = _PREFIX_RE.match(name)
+    return _PREFIX_FOLDERS[match.group()] if match else None
+
+
+# Item names shown as examples, placed by classify() so they match the rules
+_EXAMPLE_ITEMS = (
+    "BRONZE_SalesData_Lakehouse",
+    "01_IngestData_Notebook",
+    "SILVER_Cleaned_Lakehouse",
+    "10_Transform_Notebook",
+    "GOLD_Analytics_Lakehouse",
+    "20_BuildKPIs_Notebook",
+    "50_Orchestration_Notebook",
+)
+
+
+def _collapse_colors(lines):
+    """Drop redundant ANSI codes between consecutive color-wrapped lines
+
+    Colors persist across newlines, so a line only needs its opening code
+    when the color changes, and only the final line needs the reset.
+    """
+    collapsed = []
+    current = None
+    for line in lines:
+        if not line:
+            # Blank lines show no color, so they need no codes either
+            collapsed.append(line)
+            continue
+        
+        color = next(
+            (c for c in _COLORS if line.startswith(c) and line.endswith(END)), None
+        )
+        if color is None:
+            # Uncolored line: close any open color before it
+            if current is not None:
+                collapsed[-1] += END
+                current = None
+            collapsed.append(line)
+            continue
+        
+        body = line[len(color):-len(END)]
+        collapsed.append(body if color == current else color + body)
+        current = color
+    
+    if current is not None:
+        collapsed[-1] += END
+    return collapsed
+
+
+def _emit(text):
+    """Write text in one call, encoding it to UTF-8 once when stdout allows"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = getattr(sys.stdout, "encoding", None)
+    if buffer is None or not encoding or codecs.lookup(encoding).name != "utf-8":
+        # StringIO-style, encoding-less or non-UTF-8 streams use the text layer
+        sys.stdout.write(text)
         return
     
+    # Flush pending text first so byte output stays in order
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8"))
+
+
+def _render(out):
+    """Join buffered output lines into the text emitted in one write"""
+    return "\n".join(_collapse_colors(out)) + "\n"
+
+
+@lru_cache(maxsize=8)
+def _render_structure(template_name):
+    """Render the preview for a known template (output is fixed per template)"""
     template = TEMPLATES[template_name]
+    out = []
+    
+    out.append("")
     
-    print_success(f"\n🔍 DRY RUN - Preview of '{template['name']}' Structure")
-    print_info(f"Description: {template['description']}\n")
+    out.append(_SUCCESS_FMT % f"🔍 DRY RUN - Preview of '{template.name}' Structure")
+    out.append(_INFO_FMT % f"Description: {template.description}")
+    out.append("")
     
-    print_info("📁 Folder Structure:")
-    print_info("=" * 80)
+    out.append(_INFO_FMT % "📁 Folder Structure:")
+    out.append(_INFO_FMT % _EQ)
     
-    total_folders = 0
+    total_folders = sum(1 + len(folder.subfolders) for folder in template.folders)
     
-    for folder in template["folders"]:
-        print_success(f"\n├── {folder['name']}")
-        print_info(f"│   └── {folder['description']}")
-        total_folders += 1
+    for folder in template.folders:
+        out.append("")
+        out.append(_SUCCESS_FMT % f"├── {folder.name}")
+        out.append(_INFO_FMT % f"│   └── {folder.description}")
         
-        if "subfolders" in folder:
-            for i, subfolder in enumerate(folder["subfolders"]):
-                is_last = i == len(folder["subfolders"]) - 1
-                prefix = "└──" if is_last else "├──"
-                print_success(f"│   {prefix} {subfolder['name']}")
-                print_info(f"│       └── {subfolder['description']}")
-                total_folders += 1
-    
-    print_info("\n" + "=" * 80)
-    print_success(f"\n✅ Total Folders: {total_folders}")
-    print_warning("\n⚠️  This is a preview only - no folders created!")
-    print_info("\nTo create this structure, run:")
-    print_info(f"  python tools/manage_fabric_folders.py create-structure \\")
-    print_info(f"      --workspace \"Your Workspace Name\" \\")
-    print_info(f"      --template {template_name}")
+        if folder.subfolders:
+            *head, last = folder.subfolders
+            for subfolder in head:
+                out.append(_SUCCESS_FMT % f"│   ├── {subfolder.name}")
+                out.append(_INFO_FMT % f"│       └── {subfolder.description}")
+            out.append(_SUCCESS_FMT % f"│   └── {last.name}")
+            out.append(_INFO_FMT % f"│       └── {last.description}")
+    
+    out.append("")
+    
+    out.append(_INFO_FMT % _EQ)
+    out.append("")
+    out.append(_SUCCESS_FMT % f"✅ Total Folders: {total_folders}")
+    out.append("")
+    out.append(_WARNING_FMT % "⚠️  This is a preview only - no folders created!")
+    out.append("")
+    out.append(_INFO_FMT % "To create this structure, run:")
+    out.append(_INFO_FMT % "  python tools/manage_fabric_folders.py create-structure \\")
+    out.append(_INFO_FMT % "      --workspace \"Your Workspace Name\" \\")
+    out.append(_INFO_FMT % f"      --template {template_name}")
+    
+    return _render(out)
 
 
-def preview_intelligent_placement():
-    """Preview intelligent item placement rules"""
+def preview_structure(template_name="medallion"):
+    """Preview folder structure without credentials"""
     
-    print_success("\n🎯 Intelligent Item Placement Rules")
-    print_info("=" * 80)
+    if template_name not in TEMPLATES:
+        print_warning(f"Unknown template: {template_name}")
+        print_info(f"Available templates: {', '.join(_TEMPLATE_CHOICES)}")
+        return
     
-    rules = [
-        ("BRONZE_*", "Bronze Layer/Raw Data", "Items prefixed with BRONZE_"),
-        ("SILVER_*", "Silver Layer/Cleaned", "Items prefixed with SILVER_"),
-        ("GOLD_*", "Gold Layer/Analytics", "Items prefixed with GOLD_"),
-        ("01-09_*", "Bronze Layer/Raw Data", "Notebooks numbered 01-09"),
-        ("10-19_*", "Silver Layer/Transformed", "Notebooks numbered 10-19"),
-        ("20-29_*", "Gold Layer/Analytics", "Notebooks numbered 20-29"),
-        ("50+_*", "Workspace Root", "Notebooks numbered 50+"),
-    ]
+    _emit(_render_structure(template_name))
+
+
+@lru_cache(maxsize=None)
+def _render_placement():
+    """Render the placement rules (static, so built once on first use)"""
+    out = []
+    out.append("")
+    out.append(_SUCCESS_FMT % "🎯 Intelligent Item Placement Rules")
+    out.append(_INFO_FMT % _EQ)
+    
+    out.append("")
+    
+    out.append(_INFO_FMT % "Item Naming Pattern → Target Folder")
+    out.append(_INFO_FMT % _DASH)
     
-    print_info("\nItem Naming Pattern → Target Folder")
-    print_info("-" * 80)
+    for rule_line, description_line in _RULES_RENDERED:
+        out.append(rule_line)
+        out.append(description_line)
     
-    for pattern, folder, description in rules:
-        print_success(f"  {pattern:15} → {folder}")
-        print_info(f"                    ({description})")
+    out.append("")
     
-    print_info("\n" + "=" * 80)
-    print_info("\n💡 Examples:")
-    print_success("  BRONZE_SalesData_Lakehouse  → Bronze Layer/Raw Data")
-    print_success("  01_IngestData_Notebook      → Bronze Layer/Raw Data")
-    print_success("  SILVER_Cleaned_Lakehouse    → Silver Layer/Cleaned")
-    print_success("  10_Transform_Notebook       → Silver Layer/Transformed")
-    print_success("  GOLD_Analytics_Lakehouse    → Gold Layer/Analytics")
-    print_success("  20_BuildKPIs_Notebook       → Gold Layer/Analytics")
-    print_success("  50_Orchestration_Notebook   → Workspace Root")
+    out.append(_INFO_FMT % _EQ)
+    out.append("")
+    out.append(_INFO_FMT % "💡 Examples:")
+    for name in _EXAMPLE_ITEMS:
+        out.append(_SUCCESS_FMT % f"  {name.ljust(27)} → {classify(name)}")
+    
+    return _render(out)
 
 
-def main():
-    """Main entry point"""
+def preview_intelligent_placement():
+    """Preview intelligent item placement rules"""
+    _emit(_render_placement())
+
+
+def _add_preview_arguments(parser, suppress_defaults=False):
+    """Register the options shared by the default and 'preview' invocations
+
+    The 'preview' subparser passes suppress_defaults=True so its copies only
+    set a value when given after the subcommand; otherwise their defaults
+    would overwrite the same flags given before it.
+    """
     import argparse
     
-    parser = argparse.ArgumentParser(
-        description="Preview folder structures without credentials",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
     parser.add_argument(
         "--template",
-        default="medallion",
-        choices=["medallion"],
+        default=argparse.SUPPRESS if suppress_defaults else "medallion",
+        choices=_TEMPLATE_CHOICES,
         help="Template to preview (default: medallion)"
     )
     
     parser.add_argument(
         "--show-placement",
         action="store_true",
+        default=argparse.SUPPRESS if suppress_defaults else False,
         help="Show intelligent item placement rules"
     )
-    
-    args = parser.parse_args()
-    
-    # Preview structure
+
+
+def _run_preview(args):
+    """Preview a template, optionally followed by the placement rules"""
     preview_structure(args.template)
     
     # Show placement rules if requested
     if args.show_placement:
         preview_intelligent_placement()
+
+
+def _run_placement(args):
+    """Show only the placement rules"""
+    preview_intelligent_placement()
+
+
+# Subcommand -> (help text, argument registrar, handler)
+_COMMANDS = {
+    "preview": ("Preview a folder structure template", _add_preview_arguments, _run_preview),
+    "placement": ("Show intelligent item placement rules", None, _run_placement),
+}
+
+
+def _build_parser(command=None):
+    """Build the CLI parser, registering only `command`'s subparser when known"""
+    # Imported here so importing preview_structure as a library skips argparse
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Preview folder structures without credentials"
+    )
+    
+    # Flat options keep `--template X --show-placement` working without a subcommand
+    _add_preview_arguments(parser)
+    parser.set_defaults(handler=_run_preview)
+    
+    subparsers = parser.add_subparsers(dest="command", metavar="{" + ",".join(_COMMANDS) + "}")
+    names = (command,) if command in _COMMANDS else tuple(_COMMANDS)
+    for name in names:
+        help_text, add_arguments, handler = _COMMANDS[name]
+        subparser = subparsers.add_parser(name, help=help_text)
+        if add_arguments:
+            add_arguments(subparser, suppress_defaults=True)
+        subparser.set_defaults(handler=handler)
+    
+    return parser
+
+
+def main(argv=None):
+    """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Sniff the subcommand so only its parser is built; --help gets them all
+    command = argv[0] if argv and argv[0] in _COMMANDS else None
+    args = _build_parser(command).parse_args(argv)
+    
+    args.handler(args)
     
     print()
 